@@ -22,7 +22,8 @@
 # A set of functions to filter variables in the debugger.
 # Each function should return True if the variable matches the filter.
 # The filtration is done on the IDE side.
-# Both name and type are strings
+# Both name and type are strings; the type comes already lowercased so
+# the hot per-variable loop does not allocate a new string per filter
 
 
 def filterLocalVariables(isGlobal, varName, varType):
@@ -50,42 +51,42 @@ def filterTypes(isGlobal, varName, varType):
     """Filters out types"""
     del isGlobal    # unused argument
     del varName     # unused argument
-    return varType.lower() == 'type'
+    return varType == 'type'
 
 
 def filterClassMethods(isGlobal, varName, varType):
     """Filters out methods"""
     del isGlobal    # unused argument
     del varName     # unused argument
-    return varType.lower() == 'class method'
+    return varType == 'class method'
 
 
 def filterFunctions(isGlobal, varName, varType):
     """Filters out functions"""
     del isGlobal    # unused argument
     del varName     # unused argument
-    return varType.lower() == 'function'
+    return varType == 'function'
 
 
 def filterBuiltinFunctions(isGlobal, varName, varType):
     """Filters out builtin functions"""
     del isGlobal    # unused argument
     del varName     # unused argument
-    return varType.lower() in ['method-wrapper', 'builtin function']
+    return varType in ('method-wrapper', 'builtin function')
 
 
 def filterModules(isGlobal, varName, varType):
     """Filters out modules"""
     del isGlobal    # unused argument
     del varName     # unused argument
-    return varType.lower() == 'module'
+    return varType == 'module'
 
 
 def filterNones(isGlobal, varName, varType):
     """Filters out None-type variables"""
     del isGlobal    # unused argument
     del varName     # unused argument
-    return varType.lower() == 'none'
+    return varType == 'none'
 
 
 
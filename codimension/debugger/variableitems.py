@@ -27,6 +27,20 @@ from utils.pixmapcache import getIcon
 
 INDICATORS = ("()", "[]", "{:}", "{}")
 
+# getIcon() constructs a new QIcon every call so the two scope icons are
+# shared between all the items. Resolved lazily: icons need the
+# application instance which does not exist at import time.
+__scopeIcons = {}
+
+
+def getScopeIcon(isGlobal):
+    """Provides the shared global/local scope icon"""
+    icon = __scopeIcons.get(isGlobal)
+    if icon is None:
+        icon = getIcon('globvar.png' if isGlobal else 'locvar.png')
+        __scopeIcons[isGlobal] = icon
+    return icon
+
 
 def getDisplayValue(displayValue):
     """Takes potentially multilined value and converts it to a single line"""
@@ -95,6 +109,11 @@ class VariableItem(QTreeWidgetItem):
 
     """Base structure for variable items"""
 
+    # Thousands of items may be created per debugger step so avoid
+    # carrying a per-instance __dict__
+    __slots__ = ('__isGlobal', '__value', '__type', '__name', '__varID',
+                 '__roleData', 'populated')
+
     def __init__(self, parent, isGlobal,
                  displayName, displayValue, displayType):
         self.__isGlobal = isGlobal
@@ -107,15 +126,24 @@ class VariableItem(QTreeWidgetItem):
         displayValue = getDisplayValue(displayValue)
 
         # Decide about the tooltip
-        self.__tooltip = "Name: " + self.__name + "\n" + \
-                         "Type: " + displayType + "\n" + \
-                         "Value: "
+        tooltip = "Name: " + self.__name + "\n" + \
+                  "Type: " + displayType + "\n" + \
+                  "Value: "
 
         tooltipDisplayValue = getTooltipValue(self.__value)
         if '\r' in tooltipDisplayValue or '\n' in tooltipDisplayValue:
-            self.__tooltip += "\n" + tooltipDisplayValue
+            tooltip += "\n" + tooltipDisplayValue
         else:
-            self.__tooltip += tooltipDisplayValue
+            tooltip += tooltipDisplayValue
+
+        # A per-item jump table: data() serves every precomputed value
+        # with a single dictionary hit instead of a chain of branches.
+        # Only the top level items have a decoration icon.
+        self.__roleData = {(0, Qt.ToolTipRole): tooltip,
+                           (1, Qt.ToolTipRole): tooltip,
+                           (2, Qt.ToolTipRole): tooltip}
+        if not isinstance(parent, QTreeWidgetItem):
+            self.__roleData[(0, Qt.DecorationRole)] = getScopeIcon(isGlobal)
 
         QTreeWidgetItem.__init__(self, parent, [self.__name, displayValue,
                                                 displayType])
@@ -176,16 +204,9 @@ class VariableItem(QTreeWidgetItem):
 
     def data(self, column, role):
         """Provides the data for the requested role"""
-        if role == Qt.ToolTipRole:
-            return self.__tooltip
-        if role == Qt.DecorationRole:
-            if column == 0:
-                if not self.parent():
-                    if self.__isGlobal:
-                        fileName = 'globvar.png'
-                    else:
-                        fileName = 'locvar.png'
-                    return getIcon(fileName)
+        value = self.__roleData.get((column, role))
+        if value is not None:
+            return value
         return QTreeWidgetItem.data(self, column, role)
 
     def attachDummy(self):
@@ -213,6 +234,8 @@ class SpecialVariableItem(VariableItem):
        tuples and dictionaries.
     """
 
+    __slots__ = ('frameNumber', '__debugger')
+
     def __init__(self, parent, debugger, isGlobal,
                  displayName, displayValue, displayType, frameNumber):
         VariableItem.__init__(self, parent, isGlobal,
@@ -245,6 +268,8 @@ class ArrayElementVariableItem(VariableItem):
 
     """Represents an array element"""
 
+    __slots__ = ()
+
     def __init__(self, parent, isGlobal,
                  displayName, displayValue, displayType):
         VariableItem.__init__(self, parent, isGlobal,
@@ -264,6 +289,8 @@ class SpecialArrayElementVariableItem(SpecialVariableItem):
 
     """Represents a special array variable node"""
 
+    __slots__ = ()
+
     def __init__(self, parent, debugger, isGlobal,
                  displayName, displayValue, displayType, frameNumber):
         SpecialVariableItem.__init__(self, parent, debugger, isGlobal,
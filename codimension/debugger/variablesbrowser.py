@@ -20,7 +20,11 @@
 """The debugger namespace viewer implementation"""
 
 
-from ui.qt import (Qt, QRegExp, QAbstractItemView, QHeaderView, QTreeWidget)
+import sys
+import re
+import ast
+from functools import lru_cache
+from ui.qt import Qt, QAbstractItemView, QHeaderView, QTreeWidget
 from ui.itemdelegates import NoOutlineHeightDelegate
 from utils.settings import Settings
 from .variableitems import (VariableItem, SpecialVariableItem,
@@ -32,19 +36,32 @@ from .viewvariable import ViewVariableDialog
 from .client.protocol_cdm_dbg import VAR_TYPE_DISP_STRINGS
 
 
-INDICATOR_PATTERN = "|".join([QRegExp.escape(indicator)
+# The class/array detection patterns run for every received variable so
+# they use the compiled Python re engine which is considerably faster
+# than QRegExp for these scans
+INDICATOR_PATTERN = "|".join([re.escape(indicator)
                               for indicator in INDICATORS])
-RX_CLASS = QRegExp('<.*(instance|object) at 0x.*>')
-RX_CLASS2 = QRegExp('class .*')
-RX_CLASS3 = QRegExp('<class .* at 0x.*>')
-DVAR_RX_CLASS1 = QRegExp(
+RX_CLASS = re.compile('<.*(instance|object) at 0x.*>')
+RX_CLASS2 = re.compile('class .*')
+RX_CLASS3 = re.compile('<class .* at 0x.*>')
+DVAR_RX_CLASS1 = re.compile(
     r'<.*(instance|object) at 0x.*>({0})'.format(INDICATOR_PATTERN))
-DVAR_RX_CLASS2 = QRegExp(
+DVAR_RX_CLASS2 = re.compile(
     r'<class .* at 0x.*>({0})'.format(INDICATOR_PATTERN))
-DVAR_RX_ARRAY_ELEMENT = QRegExp(r'^\d+$')
-DVAR_RX_SPECIAL_ARRAY_ELEMENT = QRegExp(
-    r'^\d+({0})$'.format(INDICATOR_PATTERN))
-RX_NONPRINTABLE = QRegExp(r"""(\\x\d\d)+""")
+DVAR_RX_ARRAY_ELEMENT = re.compile(r'\d+')
+DVAR_RX_SPECIAL_ARRAY_ELEMENT = re.compile(
+    r'\d+({0})'.format(INDICATOR_PATTERN))
+RX_NONPRINTABLE = re.compile(r'\\x\d\d')
+
+# The debugger sends a small bounded set of type names so the display
+# strings are resolved via a single dictionary hit. Both the original and
+# the lowercase spellings are precomputed and the strings are interned so
+# the hot path needs neither .lower() nor a fallback
+DISPLAY_TYPE_MAP = {}
+for __varType, __dispString in VAR_TYPE_DISP_STRINGS.items():
+    DISPLAY_TYPE_MAP[sys.intern(__varType)] = sys.intern(__dispString)
+    DISPLAY_TYPE_MAP[sys.intern(__varType.lower())] = sys.intern(__dispString)
+DISPLAY_TYPE_MAP['classobj'] = VAR_TYPE_DISP_STRINGS['instance']
 
 TYPE_TO_INDICATORS = {
     # Python types
@@ -54,6 +71,24 @@ TYPE_TO_INDICATORS = {
     'set': '{}',
     'frozenset': '{}'}
 
+# Prebuilt type groups so that classifying a variable does not construct
+# a new list per call
+STRING_TYPES = frozenset(('str', 'unicode'))
+SIZED_SPECIAL_TYPES = frozenset(('numpy.ndarray', 'django.MultiValueDict',
+                                 'array.array'))
+
+
+@lru_cache(maxsize=4096)
+def decodeStringValue(varValue):
+    """Decodes a repr'd string value; None if it is not one"""
+    try:
+        value = ast.literal_eval(varValue)
+    except Exception:
+        return None
+    if isinstance(value, str):
+        return value
+    return None
+
 
 class VariablesBrowser(QTreeWidget):
 
@@ -84,8 +119,10 @@ class VariablesBrowser(QTreeWidget):
         self.framenr = 0
         self.__debugger = debugger
 
-        # Ugly filtering support
-        self.__filterIsSet = False
+        # Filtering support: the enabled filter functions are precomputed
+        # on a filter change so the per-variable loop does not consult
+        # the settings
+        self.__activeFilters = []
 
         self.setSortingEnabled(True)
 
@@ -131,17 +168,37 @@ class VariablesBrowser(QTreeWidget):
 
     def __clearScopeVariables(self, areGlobals):
         """Removes those variables which belong to the specified frame"""
-        count = self.topLevelItemCount()
-        for index in range(count - 1, -1, -1):
-            item = self.topLevelItem(index)
-            if item.isGlobal() == areGlobals:
-                self.takeTopLevelItem(index)
+        # takeTopLevelItem() shifts the remaining items so calling it in
+        # a loop is quadratic; take everything once and add back what is
+        # to be kept instead. The kept items come back collapsed and
+        # deselected; showVariables() restores both from openItems and
+        # the memorized current item path
+        if self.topLevelItemCount() == 0:
+            return
+        keptItems = [item
+                     for item in self.invisibleRootItem().takeChildren()
+                     if item.isGlobal() != areGlobals]
+        if keptItems:
+            self.addTopLevelItems(keptItems)
+            if self.__activeFilters:
+                # The hidden state lives in the view so the re-added
+                # items come back visible; re-apply the filters to them
+                for item in keptItems:
+                    toShow = self.__variableToShow(item.getName(),
+                                                   item.isGlobal(),
+                                                   item.getType())
+                    item.setHidden(not toShow)
+                    if toShow:
+                        self.__applyFiltersRecursively(item)
 
     def showVariables(self, areGlobals, vlist, frmnr):
         """Shows variables list"""
         self.current = self.currentItem()
         if self.current:
             self.curpathlist = self.__buildTreePath(self.current)
+
+        # Repaint once for the whole batch instead of once per item
+        self.setUpdatesEnabled(False)
         self.__clearScopeVariables(areGlobals)
         self.__scrollToItem = None
         self.framenr = frmnr
@@ -155,29 +212,41 @@ class VariablesBrowser(QTreeWidget):
                                                          item.isGlobal(),
                                                          item.getType()))
 
-            # reexpand tree
-            openItems = sorted(self.openItems[:])
-            self.openItems = []
-            for itemPath in openItems:
-                itm = self.__findItem(itemPath, 0)
-                if itm is not None:
-                    self.expandItem(itm)
-                else:
-                    self.openItems.append(itemPath)
+        # Reexpand the tree. This must happen regardless of the new scope
+        # content: the kept items of the other scope were collapsed by
+        # __clearScopeVariables()
+        openItems = sorted(self.openItems[:])
+        self.openItems = []
+        for itemPath in openItems:
+            itm = self.__findItem(itemPath, 0)
+            if itm is None:
+                self.openItems.append(itemPath)
+            elif itm.populated:
+                # expandItem() skips the populated items so the view
+                # state is restored directly
+                self.blockSignals(True)
+                itm.setExpanded(True)
+                self.blockSignals(False)
+                self.openItems.append(itemPath)
+            else:
+                self.expandItem(itm)
 
-            if self.current:
-                citm = self.__findItem(self.curpathlist, 0)
-                if citm:
-                    self.setCurrentItem(citm)
-                    citm.setSelected(True)
-                    self.scrollToItem(citm, QAbstractItemView.PositionAtTop)
-                    self.current = None
+        if self.current:
+            citm = self.__findItem(self.curpathlist, 0)
+            if citm:
+                self.setCurrentItem(citm)
+                citm.setSelected(True)
+                self.scrollToItem(citm, QAbstractItemView.PositionAtTop)
+                self.current = None
 
-            self.__resizeSections()
+        self.__resizeSections()
 
+        if len(vlist):
+            # Re-enabling the sorting resorts by the current indicator so
+            # an explicit resort here would do the same job twice
             self.resortEnabled = True
             self.setSortingEnabled(True)
-            self.__resort()
+        self.setUpdatesEnabled(True)
 
     def __resizeSections(self):
         """Resizes the variable sections"""
@@ -203,6 +272,9 @@ class VariablesBrowser(QTreeWidget):
         self.resortEnabled = False
         self.setSortingEnabled(False)
 
+        # Repaint once for the whole batch instead of once per item
+        self.setUpdatesEnabled(False)
+
         if self.current is None:
             self.current = self.currentItem()
             if self.current:
@@ -249,27 +321,28 @@ class VariablesBrowser(QTreeWidget):
 
         self.resortEnabled = resortEnabled
         if self.resortEnabled:
+            # Implies a resort by the current indicator
             self.setSortingEnabled(True)
-        self.__resort()
+        self.setUpdatesEnabled(True)
 
     def __generateItem(self, parentItem, isGlobal,
                        varName, varValue, varType, isSpecial=False):
         """Generates an appropriate variable item"""
         if isSpecial:
-            if DVAR_RX_CLASS1.exactMatch(varName) or \
-               DVAR_RX_CLASS2.exactMatch(varName):
+            if DVAR_RX_CLASS1.fullmatch(varName) or \
+               DVAR_RX_CLASS2.fullmatch(varName):
                 isSpecial = False
 
-        if RX_CLASS2.exactMatch(varType):
+        if RX_CLASS2.fullmatch(varType):
             return SpecialVariableItem(parentItem, self.__debugger, isGlobal,
                                        varName, varValue, varType[7:-1],
                                        self.framenr)
 
         elif varType != "void *" and \
-             (RX_CLASS.exactMatch(varValue) or
-              RX_CLASS3.exactMatch(varValue) or
+             (RX_CLASS.fullmatch(varValue) or
+              RX_CLASS3.fullmatch(varValue) or
               isSpecial):
-            if DVAR_RX_SPECIAL_ARRAY_ELEMENT.exactMatch(varName):
+            if DVAR_RX_SPECIAL_ARRAY_ELEMENT.fullmatch(varName):
                 return SpecialArrayElementVariableItem(parentItem,
                                                        self.__debugger,
                                                        isGlobal,
@@ -279,13 +352,12 @@ class VariablesBrowser(QTreeWidget):
             return SpecialVariableItem(parentItem, self.__debugger, isGlobal,
                                        varName, varValue, varType,
                                        self.framenr)
-        elif varType in ["numpy.ndarray", "django.MultiValueDict",
-                         "array.array"]:
+        elif varType in SIZED_SPECIAL_TYPES:
             return SpecialVariableItem(parentItem, self.__debugger, isGlobal,
                                        varName, "{0} items".format(varValue),
                                        varType, self.framenr)
         else:
-            if DVAR_RX_ARRAY_ELEMENT.exactMatch(varName):
+            if DVAR_RX_ARRAY_ELEMENT.fullmatch(varName):
                 return ArrayElementVariableItem(parentItem, isGlobal,
                                                 varName, varValue, varType)
             return VariableItem(parentItem, isGlobal,
@@ -293,16 +365,11 @@ class VariablesBrowser(QTreeWidget):
 
         print("WARNING: Reached the end without forming a variable!")
 
-    def __getDisplayType(self, varType):
+    @staticmethod
+    def __getDisplayType(varType):
         """Provides a variable type for display purpose"""
-        try:
-            dvtype = VAR_TYPE_DISP_STRINGS[varType]
-        except KeyError:
-            if varType == 'classobj':
-                dvtype = VAR_TYPE_DISP_STRINGS['instance']
-            else:
-                dvtype = varType
-        return dvtype
+        return DISPLAY_TYPE_MAP.get(varType) or \
+            DISPLAY_TYPE_MAP.get(varType.lower(), varType)
 
     def __addItem(self, parentItem, isGlobal, varType, varName, varValue):
         """Adds a new item to the children of the parentItem"""
@@ -315,20 +382,20 @@ class VariablesBrowser(QTreeWidget):
             pass
 
         displayType = self.__getDisplayType(varType)
-        if varType in ['list', 'tuple', 'dict', 'set', 'frozenset']:
+        if varType in TYPE_TO_INDICATORS:
             return self.__generateItem(parentItem, isGlobal,
                                        varName, str(varValue) + " item(s)",
                                        displayType,
                                        True)
-        if varType in ['unicode', 'str']:
-            if RX_NONPRINTABLE.indexIn(varValue) != -1:
+        if varType in STRING_TYPES:
+            if RX_NONPRINTABLE.search(varValue):
                 stringValue = varValue
             else:
-                try:
-                    stringValue = eval(varValue)
-                    displayType += " (chars: " + str(len(stringValue)) + ")"
-                except:
+                stringValue = decodeStringValue(varValue)
+                if stringValue is None:
                     stringValue = varValue
+                else:
+                    displayType += " (chars: " + str(len(stringValue)) + ")"
             return self.__generateItem(parentItem, isGlobal,
                                        varName, stringValue,
                                        displayType)
@@ -443,11 +510,11 @@ class VariablesBrowser(QTreeWidget):
 
     def filterChanged(self):
         """Sets the new filter"""
-        self.__filterIsSet = False
-        for _, settingName, _ in VARIABLE_FILTERS:
-            if not Settings()[settingName]:
-                self.__filterIsSet = True
-                break
+        settings = Settings()
+        self.__activeFilters = [
+            matchFunction
+            for _, settingName, matchFunction in VARIABLE_FILTERS
+            if not settings[settingName]]
         self.__applyFilters()
 
     def __applyFilters(self):
@@ -468,25 +535,26 @@ class VariablesBrowser(QTreeWidget):
         self.__resizeSections()
         self.resortEnabled = resortEnabled
         if self.resortEnabled:
+            # Implies a resort by the current indicator
             self.setSortingEnabled(True)
-        self.__resort()
 
     def __applyFiltersRecursively(self, item):
         """Applies the filter recursively to all the children of the item"""
         for index in range(item.childCount()):
             childItem = item.child(index)
-            if not hasattr(childItem, "getName"):
+            if not isinstance(childItem, VariableItem):
+                # e.g. the lazy population placeholder
                 continue
             toShow = self.__variableToShow(childItem.getName(),
                                            childItem.isGlobal(),
                                            childItem.getType())
             childItem.setHidden(not toShow)
-            if toShow:
+            if toShow and childItem.childCount() > 0:
                 self.__applyFiltersRecursively(childItem)
 
     def __variableToShow(self, varName, isGlobal, varType):
         """Checks if the given item should be shown"""
-        if not self.__filterIsSet:
+        if not self.__activeFilters:
             return True
 
         # Strip indicators from the name
@@ -496,9 +564,10 @@ class VariablesBrowser(QTreeWidget):
            varName.endswith(")"):
             varName = varName[:-2]   # Strip display purpose decor if so
 
-        settings = Settings()
-        for _, settingName, matchFunction in VARIABLE_FILTERS:
-            if settings[settingName] is False:
-                if matchFunction(isGlobal, varName, varType):
-                    return False
+        # Lowercase once per variable; the filters expect it this way
+        varType = varType.lower()
+
+        for matchFunction in self.__activeFilters:
+            if matchFunction(isGlobal, varName, varType):
+                return False
         return True
@@ -22,7 +22,7 @@
 
 from ui.qt import (Qt, QFrame, QVBoxLayout, QWidget, QSizePolicy, QMenu,
                    QSpacerItem, QGridLayout, QToolButton, QPushButton,
-                   QToolBar, QSize)
+                   QToolBar, QSize, QTimer)
 from ui.combobox import CDMComboBox
 from ui.labels import HeaderFitLabel
 from utils.pixmapcache import getIcon
@@ -48,6 +48,13 @@ class VariablesViewer(QWidget):
         self.__browser = VariablesBrowser(debugger, self)
         self.__createLayout()
 
+        # Updating the header means counting all the top level items so
+        # coalesce the bursts (globals + locals arrive per step) into one
+        # deferred recount
+        self.__headerTimer = QTimer(self)
+        self.__headerTimer.setSingleShot(True)
+        self.__headerTimer.timeout.connect(self.__updateHeaderLabel)
+
         self.setTabOrder(self.__browser, self.__execStatement)
         self.setTabOrder(self.__execStatement, self.__execButton)
 
@@ -135,12 +142,17 @@ class VariablesViewer(QWidget):
     def updateVariables(self, areGlobals, frameNumber, variables):
         """Triggered when a new set of variables is received"""
         self.__browser.showVariables(areGlobals, variables, frameNumber)
-        self.__updateHeaderLabel()
+        self.__scheduleHeaderUpdate()
 
     def updateVariable(self, areGlobals, variables):
         """Triggered when a new variable has been received"""
         self.__browser.showVariable(areGlobals, variables)
-        self.__updateHeaderLabel()
+        self.__scheduleHeaderUpdate()
+
+    def __scheduleHeaderUpdate(self):
+        """Coalesces the header label updates"""
+        if not self.__headerTimer.isActive():
+            self.__headerTimer.start(0)
 
     def __updateHeaderLabel(self):
         """Updates the header text"""
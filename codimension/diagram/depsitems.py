@@ -20,13 +20,60 @@
 """Dependency diagram grphics items"""
 
 import os
-from ui.qt import Qt, QPointF, QPen, QBrush, QGraphicsRectItem, QGraphicsItem
+import sys
+from ui.qt import (Qt, QPointF, QPen, QBrush, QGraphicsRectItem,
+                   QGraphicsItem, QGraphicsSimpleTextItem)
 from flowui.cellelement import CellElement
 from flowui.textmixin import TextMixin
 from flowui.auxitems import BadgeItem, Connector
 from flowui.abovebadges import AboveBadgesSpacer
 from utils.globals import GlobalData
 
+# The same (font, text) pair always yields the same metrics so measure once.
+# The font key is a part of the cache key thus a font change does not lead
+# to stale results
+__textMetricsCache = {}
+
+
+def getCachedBoundingRect(item, text):
+    """Provides a cached bounding rectangle for the item text"""
+    key = (item.canvas.settings.monoFont.key(), text)
+    rect = __textMetricsCache.get(key)
+    if rect is None:
+        rect = CellElement.getBoundingRect(item, text)
+        __textMetricsCache[key] = rect
+    return rect
+
+
+# Pens and brushes are immutable as used here so share them between items
+# instead of constructing new Qt objects on every repaint
+__penCache = {}
+__brushCache = {}
+
+
+def getCachedPen(color, width=None):
+    """Provides a shared pen for the given color and optional width"""
+    key = (color.rgba(), width)
+    pen = __penCache.get(key)
+    if pen is None:
+        pen = QPen(color)
+        if width is not None:
+            pen.setWidth(width)
+            pen.setJoinStyle(Qt.RoundJoin)
+        __penCache[key] = pen
+    return pen
+
+
+def getCachedBrush(color):
+    """Provides a shared brush for the given color"""
+    key = color.rgba()
+    brush = __brushCache.get(key)
+    if brush is None:
+        brush = QBrush(color)
+        __brushCache[key] = brush
+    return brush
+
+
 class SelfModule(CellElement, TextMixin, QGraphicsRectItem):
 
     """Represents the module for which the dependencies are drawn"""
@@ -38,17 +85,48 @@ class SelfModule(CellElement, TextMixin, QGraphicsRectItem):
         self.kind = CellElement.DEPS_SELF_MODULE
         self.fileName = fileName
 
+        # The display name never changes within the item lifetime; it is
+        # interned so identical basenames share one string object and the
+        # text metrics cache hashes faster
+        self.__displayName = sys.intern(
+            os.path.basename(fileName).partition('.')[0])
+
         self.__needConnector = needConnector
         self.connector = None
 
+        # Geometry precomputed by draw(); fixed until the next re-layout
+        self.__rectX = None
+        self.__rectY = None
+        self.__rectWidth = None
+        self.__rectHeight = None
+        self.__textX = None
+        self.__textY = None
+        self.__label = None
+
         # To make double click delivered
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
 
+        # The item is static unless the diagram is rebuilt so let Qt
+        # rasterize it once and blit the cached pixmap on the further
+        # repaints. Selection changes call update() which invalidates
+        # the cache automatically.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def getBoundingRect(self, text):
+        """Provides the bounding rectangle for a monospaced font"""
+        return getCachedBoundingRect(self, text)
+
+    def getPainterPen(self, selected, borderColor):
+        """Provides the painter pen for the item"""
+        settings = self.canvas.settings
+        if selected:
+            return getCachedPen(settings.selectColor, settings.selectPenWidth)
+        return getCachedPen(borderColor, settings.boxLineWidth)
+
     def render(self):
         """Renders the cell"""
         settings = self.canvas.settings
-        text = os.path.basename(self.fileName).split('.')[0]
-        self.setupText(self, customText=text)
+        self.setupText(self, customText=self.__displayName)
 
         vPadding = 2 * (settings.vDepsCellPadding + settings.vDepsTextPadding)
         self.minHeight = self.textRect.height() + vPadding
@@ -100,6 +178,26 @@ class SelfModule(CellElement, TextMixin, QGraphicsRectItem):
             xPos - penWidth, yPos - penWidth + takenByBadges,
             self.minWidth - 2 * settings.hDepsCellPadding + 2 * penWidth,
             self.minHeight - 2 * settings.vDepsCellPadding + 2 * penWidth - takenByBadges)
+
+        # Everything paint() needs is fixed from now on so precompute it
+        # instead of doing the arithmetics on every repaint
+        self.__rectX = xPos
+        self.__rectY = yPos + takenByBadges
+        self.__rectWidth = self.minWidth - 2 * settings.hDepsCellPadding
+        self.__rectHeight = \
+            self.minHeight - 2 * settings.vDepsCellPadding - takenByBadges
+        textWidth = self.textRect.width() + 2 * settings.hDepsTextPadding
+        textShift = (self.__rectWidth - textWidth) / 2
+        self.__textX = xPos + settings.hDepsTextPadding + textShift
+        self.__textY = self.__rectY + settings.vDepsTextPadding
+
+        # A child text item lets Qt cache the glyphs instead of
+        # re-rasterizing the label on every parent repaint
+        self.__label = QGraphicsSimpleTextItem(self.text, self)
+        self.__label.setFont(settings.monoFont)
+        self.__label.setBrush(getCachedBrush(settings.selfFGColor))
+        self.__label.setPos(self.__textX, self.__textY)
+
         scene.addItem(self)
 
     def paint(self, painter, option, widget):
@@ -109,33 +207,9 @@ class SelfModule(CellElement, TextMixin, QGraphicsRectItem):
 
         settings = self.canvas.settings
         painter.setPen(self.getPainterPen(self.isSelected(), settings.selfBorderColor))
-        painter.setBrush(QBrush(settings.selfBGColor))
-
-        rectWidth = self.minWidth - 2 * settings.hDepsCellPadding
-        rectHeight = self.minHeight - 2 * settings.vDepsCellPadding
-
-        yPos = self.baseY + settings.vDepsCellPadding
-        if self.aboveBadges.hasAny():
-            badgeShift = self.aboveBadges.height + settings.badgeToScopeVPadding
-            yPos += badgeShift
-            rectHeight -= badgeShift
-
-        painter.drawRect(self.baseX + settings.hDepsCellPadding,
-                         yPos, rectWidth, rectHeight)
-
-        # Draw the text in the rectangle
-        pen = QPen(settings.selfFGColor)
-        painter.setFont(settings.monoFont)
-        painter.setPen(pen)
-
-        textWidth = self.textRect.width() + 2 * settings.hDepsTextPadding
-        textShift = (rectWidth - textWidth) / 2
-        painter.drawText(
-            self.baseX + settings.hDepsCellPadding +
-            settings.hDepsTextPadding + textShift,
-            yPos + settings.vDepsTextPadding,
-            self.textRect.width(), self.textRect.height(),
-            Qt.AlignLeft, self.text)
+        painter.setBrush(getCachedBrush(settings.selfBGColor))
+        painter.drawRect(self.__rectX, self.__rectY,
+                         self.__rectWidth, self.__rectHeight)
 
     def mouseDoubleClickEvent(self, event):
         if event.buttons() != Qt.LeftButton:
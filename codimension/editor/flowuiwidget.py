@@ -28,7 +28,7 @@ from ui.qt import (Qt, QSize, QTimer, QDir, QUrl, QSizeF, QPainter, QImage,
                    QToolBar, QWidget, QPrinter, QApplication, QHBoxLayout,
                    QLabel, QVBoxLayout, QFileDialog, QActionGroup, QAction,
                    QDialog, QMenu, QToolButton, QMessageBox, QSvgGenerator,
-                   QStackedWidget)
+                   QStackedWidget, QGraphicsScene)
 from ui.spacers import ToolBarExpandingSpacer, ToolBarVSpacer
 from cdmcfparser import getControlFlowFromMemory
 from flowui.vcanvas import VirtualCanvas, formatFlow
@@ -679,7 +679,13 @@ class FlowUIWidget(QWidget):
             width, height = self.__canvas.render()
             rEnd = timer()
             self.scene().setSceneRect(0, 0, width, height)
+
+            # Suspend the BSP indexing for the bulk item insertion:
+            # otherwise the scene re-indexes repeatedly as thousands of
+            # items arrive. Restoring the index builds the tree once.
+            self.scene().setItemIndexMethod(QGraphicsScene.NoIndex)
             self.__canvas.draw(self.scene(), 0, 0)
+            self.scene().setItemIndexMethod(QGraphicsScene.BspTreeIndex)
             dEnd = timer()
             if self.isDebugMode():
                 logging.info('Redrawing is done. Size: %d x %d', width, height)
@@ -729,7 +735,12 @@ class FlowUIWidget(QWidget):
             width, height = self.__canvas.render()
             rEnd = timer()
             self.scene().setSceneRect(0, 0, width, height)
+
+            # See __processFS(): bulk insertion is faster with the scene
+            # indexing suspended
+            self.scene().setItemIndexMethod(QGraphicsScene.NoIndex)
             self.__canvas.draw(self.scene(), 0, 0)
+            self.scene().setItemIndexMethod(QGraphicsScene.BspTreeIndex)
             dEnd = timer()
             if self.isDebugMode():
                 logging.info('Redrawing is done. Size: %d x %d', width, height)
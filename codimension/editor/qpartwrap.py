@@ -48,6 +48,9 @@ class QutepartWrapper(Qutepart):
     matchesRegexp = None
     highlightOn = False
 
+    # Editors which currently hold a populated matches cache
+    cachedMatchEditors = set()
+
     def __init__(self, parent):
         Qutepart.__init__(self, needMarkArea=False, needLineNumbers=False,
                           needCompleter=False)
@@ -415,6 +418,7 @@ class QutepartWrapper(Qutepart):
         """Resets the matches cache when the text is modified"""
         # The highlight does not need to be switched off
         self.__matchesCache = None
+        QutepartWrapper.cachedMatchEditors.discard(self)
 
     def resetMatchCache(self):
         """Resets the matches cache.
@@ -425,25 +429,29 @@ class QutepartWrapper(Qutepart):
             if self._userExtraSelections:
                 self.setExtraSelections([])
         self.__matchesCache = None
+        QutepartWrapper.cachedMatchEditors.discard(self)
 
     def __searchInText(self, regExp, startPoint, forward):
-        """Search in text and return the nearest match"""
+        """Search in text and return the nearest match with its index"""
         self.findAllMatches(regExp)
         if self.__matchesCache:
             if forward:
-                for match in self.__matchesCache:
+                for index, match in enumerate(self.__matchesCache):
                     if match.start() >= startPoint:
                         break
                 else:  # wrap, search from start
+                    index = 0
                     match = self.__matchesCache[0]
             else:  # reverse search
-                for match in self.__matchesCache[::-1]:
+                for index in range(len(self.__matchesCache) - 1, -1, -1):
+                    match = self.__matchesCache[index]
                     if match.start() <= startPoint:
                         break
                 else:  # wrap, search from end
-                    match = self.__matchesCache[-1]
-            return match
-        return None
+                    index = len(self.__matchesCache) - 1
+                    match = self.__matchesCache[index]
+            return match, index
+        return None, None
 
     def isCursorOnMatch(self):
         """True if the cursor is on the first pos of any match"""
@@ -538,6 +546,7 @@ class QutepartWrapper(Qutepart):
             QutepartWrapper.matchesRegexp = regExp
             self.__matchesCache = [match
                                    for match in regExp.finditer(self.text)]
+            QutepartWrapper.cachedMatchEditors.add(self)
         QutepartWrapper.highlightOn = True
         return self.__matchesCache
 
@@ -556,9 +565,9 @@ class QutepartWrapper(Qutepart):
     def highlightRegexp(self, regExp, searchPos, forward, needMessage=True):
         """Highlights the matches, moves cursor, displays message"""
         highlighted = self.updateFoundItemsHighlighting(regExp)
-        match = self.__searchInText(regExp, searchPos, forward)
+        match, index = self.__searchInText(regExp, searchPos, forward)
         if match is not None:
-            matchIndex = self.__matchesCache.index(match) + 1
+            matchIndex = index + 1
             totalMatches = len(self.__matchesCache)
             self.absCursorPosition = match.start()
             self.ensureCursorVisible()
@@ -652,38 +661,41 @@ class QutepartWrapper(Qutepart):
         if not self.__matchesCache:
             return
 
+        # The cache is valid for the current text, so the matched fragment
+        # is exactly what the buffer holds at the match position; reading
+        # self.text serializes the whole document and must stay out of
+        # the per-match loops
         replaceCount = 0
         noReplaceCount = 0
-        for match in self.__matchesCache[::-1]:
-            textToReplace = self.text[match.start():
-                                      match.start() + len(match.group(0))]
-            if textToReplace == replaceText:
+        for match in self.__matchesCache:
+            if match.group(0) == replaceText:
                 noReplaceCount += 1
             else:
                 replaceCount += 1
 
         if replaceCount > 0:
-            cursorPos = None
-            delta = 0
             regExp = QutepartWrapper.matchesRegexp
-            with self:
-                # reverse order, because replacement may move indexes
-                for match in self.__matchesCache[::-1]:
-                    textToReplace = self.text[match.start():
-                                              match.start() +
-                                              len(match.group(0))]
-                    if textToReplace != replaceText:
-                        self.replaceText(match.start(), len(match.group(0)),
-                                         replaceText)
+            matches = self.__matchesCache
+            text = self.text
+
+            # Build the replaced span in python and apply it as a single
+            # document edit instead of one editor round trip per match
+            spanStart = matches[0].start()
+            pieces = []
+            prevEnd = spanStart
+            for match in matches:
+                pieces.append(text[prevEnd:match.start()])
+                pieces.append(replaceText)
+                prevEnd = match.start() + len(match.group(0))
 
-                    if cursorPos is None:
-                        cursorPos = self.absCursorPosition
-                    else:
-                        delta += len(replaceText) - len(textToReplace)
+            with self:
+                # replaceText leaves the cursor at the end of the span,
+                # i.e. right after the last replacement
+                self.replaceText(spanStart, prevEnd - spanStart,
+                                 ''.join(pieces))
 
             self.resetHighlight()
             self.updateFoundItemsHighlighting(regExp)
-            self.absCursorPosition = cursorPos + delta
 
         if replaceCount == 1:
             msg = '1 match replaced'
@@ -703,9 +715,8 @@ class QutepartWrapper(Qutepart):
             for match in self.__matchesCache:
                 if match.start() == pos:
                     regExp = QutepartWrapper.matchesRegexp
-                    textToReplace = self.text[match.start():
-                                              match.start() +
-                                              len(match.group(0))]
+                    # The cached match holds the buffer fragment already
+                    textToReplace = match.group(0)
                     if textToReplace == replaceText:
                         msg = "no replace: the highlight matches replacement"
                     else:
@@ -819,6 +830,7 @@ class QutepartWrapper(Qutepart):
 
     def terminate(self):
         """Cleans up memory"""
+        QutepartWrapper.cachedMatchEditors.discard(self)
         Qutepart.terminate(self)
         self.document().disconnect()
 
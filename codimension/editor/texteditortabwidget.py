@@ -755,6 +755,10 @@ class TextEditorTabWidget(QWidget):
         _, pos = self.__editor.cursorPosition
         return pos
 
+    def getLinePos(self):
+        """Tells the cursor line and column in one call"""
+        return self.__editor.cursorPosition
+
     def getEncoding(self):
         """Tells the content encoding"""
         if self.__editor.explicitUserEncoding:
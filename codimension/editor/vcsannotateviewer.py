@@ -416,6 +416,10 @@ class VCSAnnotateViewerTabWidget(QWidget, MainWindowTabWidgetBase):
         _, pos = self.__viewer.cursorPosition
         return pos
 
+    def getLinePos(self):
+        """Tells the cursor line and column in one call"""
+        return self.__viewer.cursorPosition
+
     def getEncoding(self):
         """Tells the content encoding"""
         return self.__viewer.encoding
@@ -21,6 +21,8 @@
 
 # pylint: disable=C0305
 
+from enum import IntEnum
+
 from ui.qt import QMimeData, Qt, QApplication, QPen
 from utils.globals import GlobalData
 from utils.config import DEFAULT_ENCODING
@@ -29,10 +31,17 @@ from .cml import CMLVersion
 from .routines import distance, getDocComment
 from .abovebadges import AboveBadges, AboveBadgesDivider, AboveBadgesSpacer
 
+__all__ = ['Kind', 'CellElement', 'kindToString']
 
-class CellElement:
 
-    """Base class for all the elements which could be found on the canvas"""
+class Kind(IntEnum):
+
+    """Kinds of the canvas cell elements.
+
+       The members are int compatible so all the numeric comparisons
+       in the drawing code keep working; the member names provide the
+       kind-to-name mapping for free.
+    """
 
     UNKNOWN = -1
 
@@ -110,9 +119,90 @@ class CellElement:
     # Dependencies diagram items
     DEPS_SELF_MODULE = 600
 
+
+class CellElement:
+
+    """Base class for all the elements which could be found on the canvas"""
+
+    # Source compatibility aliases: the kinds are traditionally
+    # accessed as CellElement.<NAME>
+    UNKNOWN = Kind.UNKNOWN
+
+    VCANVAS = Kind.VCANVAS
+
+    VACANT = Kind.VACANT
+    H_SPACER = Kind.H_SPACER
+    V_SPACER = Kind.V_SPACER
+    H_GROUP_SPACER = Kind.H_GROUP_SPACER
+    SPACER = Kind.SPACER
+
+    NO_SCOPE = Kind.NO_SCOPE
+    FILE_SCOPE = Kind.FILE_SCOPE
+    FUNC_SCOPE = Kind.FUNC_SCOPE
+    CLASS_SCOPE = Kind.CLASS_SCOPE
+    FOR_SCOPE = Kind.FOR_SCOPE
+    WHILE_SCOPE = Kind.WHILE_SCOPE
+    TRY_SCOPE = Kind.TRY_SCOPE
+    WITH_SCOPE = Kind.WITH_SCOPE
+    ELSE_SCOPE = Kind.ELSE_SCOPE
+    EXCEPT_SCOPE = Kind.EXCEPT_SCOPE
+    FINALLY_SCOPE = Kind.FINALLY_SCOPE
+    SCOPE_H_SIDE_EDGE = Kind.SCOPE_H_SIDE_EDGE
+    SCOPE_V_SIDE_EDGE = Kind.SCOPE_V_SIDE_EDGE
+    SCOPE_CORNER_EDGE = Kind.SCOPE_CORNER_EDGE
+
+    FOR_ELSE_SCOPE = Kind.FOR_ELSE_SCOPE
+    WHILE_ELSE_SCOPE = Kind.WHILE_ELSE_SCOPE
+    TRY_ELSE_SCOPE = Kind.TRY_ELSE_SCOPE
+
+    CODE_BLOCK = Kind.CODE_BLOCK
+    BREAK = Kind.BREAK
+    CONTINUE = Kind.CONTINUE
+    RETURN = Kind.RETURN
+    RAISE = Kind.RAISE
+    ASSERT = Kind.ASSERT
+    SYSEXIT = Kind.SYSEXIT
+    IMPORT = Kind.IMPORT
+    IF = Kind.IF
+    LEADING_COMMENT = Kind.LEADING_COMMENT
+    INDEPENDENT_COMMENT = Kind.INDEPENDENT_COMMENT
+    SIDE_COMMENT = Kind.SIDE_COMMENT
+    ABOVE_COMMENT = Kind.ABOVE_COMMENT
+    INDEPENDENT_DOC = Kind.INDEPENDENT_DOC
+    LEADING_DOC = Kind.LEADING_DOC
+    ABOVE_DOC = Kind.ABOVE_DOC
+    INDEPENDENT_MINIMIZED_COMMENT = Kind.INDEPENDENT_MINIMIZED_COMMENT
+    INDEPENDENT_MINIMIZED_DOC = Kind.INDEPENDENT_MINIMIZED_DOC
+    DECORATOR = Kind.DECORATOR
+
+    CONNECTOR = Kind.CONNECTOR
+    SVG = Kind.SVG
+    BADGE = Kind.BADGE
+    DEPENDENT_CONNECTOR = Kind.DEPENDENT_CONNECTOR
+    TEXT = Kind.TEXT
+    RUBBER_BAND = Kind.RUBBER_BAND
+    LINE = Kind.LINE
+    RECTANGLE = Kind.RECTANGLE
+    GROUP_CORNER_CONROL = Kind.GROUP_CORNER_CONROL
+    SCOPE_DOCSTRING_BADGE = Kind.SCOPE_DOCSTRING_BADGE
+    SCOPE_COMMENT_BADGE = Kind.SCOPE_COMMENT_BADGE
+    SCOPE_EXCEPT_BADGE = Kind.SCOPE_EXCEPT_BADGE
+    SCOPE_DECORATOR_BADGE = Kind.SCOPE_DECORATOR_BADGE
+    SCOPE_DOCLINK_BADGE = Kind.SCOPE_DOCLINK_BADGE
+
+    EMPTY_GROUP = Kind.EMPTY_GROUP
+    OPENED_GROUP_BEGIN = Kind.OPENED_GROUP_BEGIN
+    OPENED_GROUP_END = Kind.OPENED_GROUP_END
+    COLLAPSED_GROUP = Kind.COLLAPSED_GROUP
+
+    DEPS_SELF_MODULE = Kind.DEPS_SELF_MODULE
+
+    # The class level defaults save two instance stores per construction;
+    # the derived classes shadow them with instance attributes as needed
+    kind = UNKNOWN
+    subKind = UNKNOWN
+
     def __init__(self, ref, canvas, x, y):
-        self.kind = self.UNKNOWN
-        self.subKind = self.UNKNOWN
         self.ref = ref              # reference to the control flow object
         self.addr = [x, y]          # indexes in the current canvas
         self.canvas = canvas        # reference to the canvas
@@ -177,8 +267,8 @@ class CellElement:
 
     def render(self):
         """Renders the graphics considering settings"""
-        raise Exception("render() is not implemented for " +
-                        kindToString(self.kind))
+        raise NotImplementedError("render() is not implemented for " +
+                                  kindToString(self.kind))
 
     def drawBadges(self, scene):
         """Draws the badges raw"""
@@ -190,8 +280,8 @@ class CellElement:
         del scene   # unused argument
         del baseX   # unused argument
         del baseY   # unused argument
-        raise Exception("draw() is not implemented for " +
-                        kindToString(self.kind))
+        raise NotImplementedError("draw() is not implemented for " +
+                                  kindToString(self.kind))
 
     def getBoundingRect(self, text):
         """Provides the bounding rectangle for a monospaced font"""
@@ -389,69 +479,7 @@ class CellElement:
         return
 
 
-__kindToString = {
-    CellElement.UNKNOWN: 'UNKNOWN',
-    CellElement.VCANVAS: 'VCANVAS',
-    CellElement.VACANT: 'VACANT',
-    CellElement.H_SPACER: 'H_SPACER',
-    CellElement.V_SPACER: 'V_SPACER',
-    CellElement.H_GROUP_SPACER: 'H_GROUP_SPACER',
-    CellElement.SPACER: 'SPACER',
-    CellElement.NO_SCOPE: 'NO_SCOPE',
-    CellElement.FILE_SCOPE: 'FILE_SCOPE',
-    CellElement.FUNC_SCOPE: 'FUNC_SCOPE',
-    CellElement.CLASS_SCOPE: 'CLASS_SCOPE',
-    CellElement.FOR_SCOPE: 'FOR_SCOPE',
-    CellElement.WHILE_SCOPE: 'WHILE_SCOPE',
-    CellElement.ELSE_SCOPE: 'ELSE_SCOPE',
-    CellElement.WITH_SCOPE: 'WITH_SCOPE',
-    CellElement.TRY_SCOPE: 'TRY_SCOPE',
-    CellElement.EXCEPT_SCOPE: 'EXCEPT_SCOPE',
-    CellElement.FINALLY_SCOPE: 'FINALLY_SCOPE',
-    CellElement.SCOPE_H_SIDE_EDGE: 'SCOPE_H_SIDE_EDGE',
-    CellElement.SCOPE_V_SIDE_EDGE: 'SCOPE_V_SIDE_EDGE',
-    CellElement.SCOPE_CORNER_EDGE: 'SCOPE_CORNER_EDGE',
-    CellElement.CODE_BLOCK: 'CODE_BLOCK',
-    CellElement.BREAK: 'BREAK',
-    CellElement.CONTINUE: 'CONTINUE',
-    CellElement.RETURN: 'RETURN',
-    CellElement.RAISE: 'RAISE',
-    CellElement.ASSERT: 'ASSERT',
-    CellElement.SYSEXIT: 'SYSEXIT',
-    CellElement.IMPORT: 'IMPORT',
-    CellElement.IF: 'IF',
-    CellElement.LEADING_COMMENT: 'LEADING_COMMENT',
-    CellElement.INDEPENDENT_COMMENT: 'INDEPENDENT_COMMENT',
-    CellElement.SIDE_COMMENT: 'SIDE_COMMENT',
-    CellElement.ABOVE_COMMENT: 'ABOVE_COMMENT',
-    CellElement.INDEPENDENT_MINIMIZED_COMMENT: 'INDEPENDENT_MINIMIZED_COMMENT',
-    CellElement.INDEPENDENT_MINIMIZED_DOC: 'INDEPENDENT_MINIMIZED_DOC',
-    CellElement.DECORATOR: 'DECORATOR',
-    CellElement.CONNECTOR: 'CONNECTOR',
-    CellElement.DEPENDENT_CONNECTOR: 'DEPENDENT_CONNECTOR',
-    CellElement.SVG: 'SVG',
-    CellElement.BADGE: 'BADGE',
-    CellElement.TEXT: 'TEXT',
-    CellElement.RUBBER_BAND: 'RUBBER_BAND',
-    CellElement.LINE: 'LINE',
-    CellElement.RECTANGLE: 'RECTANGLE',
-    CellElement.GROUP_CORNER_CONROL: 'GROUP_CORNER_CONROL',
-    CellElement.SCOPE_DOCSTRING_BADGE: 'SCOPE_DOCSTRING_BADGE',
-    CellElement.SCOPE_COMMENT_BADGE: 'SCOPE_COMMENT_BADGE',
-    CellElement.SCOPE_EXCEPT_BADGE: 'SCOPE_EXCEPT_BADGE',
-    CellElement.SCOPE_DECORATOR_BADGE: 'SCOPE_DECORATOR_BADGE',
-    CellElement.SCOPE_DOCLINK_BADGE: 'SCOPE_DOCLINK_BADGE',
-    CellElement.INDEPENDENT_DOC: 'INDEPENDENT_DOC',
-    CellElement.LEADING_DOC: 'LEADING_DOC',
-    CellElement.ABOVE_DOC: 'ABOVE_DOC',
-    CellElement.EMPTY_GROUP: 'EMPTY_GROUP',
-    CellElement.OPENED_GROUP_BEGIN: 'OPENED_GROUP_BEGIN',
-    CellElement.OPENED_GROUP_END: 'OPENED_GROUP_END',
-    CellElement.COLLAPSED_GROUP: 'COLLAPSED_GROUP',
-    CellElement.DEPS_SELF_MODULE: 'DEPS_SELF_MODULE'}
-
-
 def kindToString(kind):
     """Provides a string representation of a element kind"""
-    return __kindToString[kind]
+    return Kind(kind).name
 
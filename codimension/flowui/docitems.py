@@ -164,7 +164,6 @@ class DocCellBase(CommentCellBase, ColorMixin, IconMixin, QGraphicsRectItem):
             self._leftEdge + settings.hCellPadding + settings.hDocLinkPadding,
             baseY + self.minHeight / 2 - self.iconItem.iconHeight() / 2)
         scene.addItem(self.iconItem)
-        return
 
     def paint(self, painter, option, widget):
         """Draws the independent comment"""
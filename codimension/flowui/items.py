@@ -21,6 +21,7 @@
 
 # pylint: disable=C0305
 
+from typing import final
 from ui.qt import Qt, QPointF, QPen, QBrush, QGraphicsRectItem, QGraphicsItem
 from .auxitems import Connector, BadgeItem, DecorBadgeItem
 from .cml import CMLVersion, CMLsw
@@ -31,6 +32,7 @@ from .textmixin import TextMixin
 from .abovebadges import AboveBadgesDivider, AboveBadgesSpacer
 
 
+@final
 class CodeBlockCell(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
 
     """Represents a single code block"""
@@ -38,9 +40,10 @@ class CodeBlockCell(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.codeBlockBGColor,
-                            self.canvas.settings.codeBlockFGColor,
-                            self.canvas.settings.codeBlockBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.codeBlockBGColor,
+                            settings.codeBlockFGColor,
+                            settings.codeBlockBorderColor)
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
         self.kind = CellElement.CODE_BLOCK
         self.connector = None
@@ -143,6 +146,7 @@ class CodeBlockCell(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
             CellElement.getLinesSuffix(self.getLineRange())
 
 
+@final
 class ReturnCell(CellElement,
                  TextMixin, ColorMixin, IconMixin, QGraphicsRectItem):
 
@@ -151,9 +155,10 @@ class ReturnCell(CellElement,
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.returnBGColor,
-                            self.canvas.settings.returnFGColor,
-                            self.canvas.settings.returnBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.returnBGColor,
+                            settings.returnFGColor,
+                            settings.returnBorderColor)
         IconMixin.__init__(self, canvas, 'return.svg', 'return')
         QGraphicsRectItem.__init__(self)
         self.kind = CellElement.RETURN
@@ -285,6 +290,7 @@ class ReturnCell(CellElement,
         return 'Return at ' + CellElement.getLinesSuffix(self.getLineRange())
 
 
+@final
 class RaiseCell(CellElement,
                 TextMixin, ColorMixin, IconMixin, QGraphicsRectItem):
 
@@ -293,9 +299,10 @@ class RaiseCell(CellElement,
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.raiseBGColor,
-                            self.canvas.settings.raiseFGColor,
-                            self.canvas.settings.raiseBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.raiseBGColor,
+                            settings.raiseFGColor,
+                            settings.raiseBorderColor)
         IconMixin.__init__(self, canvas, 'raise.svg', 'raise')
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
         self.kind = CellElement.RAISE
@@ -424,6 +431,7 @@ class RaiseCell(CellElement,
         return 'Raise at ' + CellElement.getLinesSuffix(self.getLineRange())
 
 
+@final
 class AssertCell(CellElement,
                  TextMixin, ColorMixin, IconMixin, QGraphicsRectItem):
 
@@ -432,9 +440,10 @@ class AssertCell(CellElement,
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.assertBGColor,
-                            self.canvas.settings.assertFGColor,
-                            self.canvas.settings.assertBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.assertBGColor,
+                            settings.assertFGColor,
+                            settings.assertBorderColor)
         IconMixin.__init__(self, canvas, 'assert.svg', 'assert')
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
         self.kind = CellElement.ASSERT
@@ -583,6 +592,7 @@ class AssertCell(CellElement,
         return 'Assert at ' + CellElement.getLinesSuffix(self.getLineRange())
 
 
+@final
 class SysexitCell(CellElement,
                   TextMixin, ColorMixin, IconMixin, QGraphicsRectItem):
 
@@ -591,9 +601,10 @@ class SysexitCell(CellElement,
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.sysexitBGColor,
-                            self.canvas.settings.sysexitFGColor,
-                            self.canvas.settings.sysexitBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.sysexitBGColor,
+                            settings.sysexitFGColor,
+                            settings.sysexitBorderColor)
         IconMixin.__init__(self, canvas, 'sysexit.svg', 'sys.exit()')
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
         self.kind = CellElement.SYSEXIT
@@ -713,6 +724,7 @@ class SysexitCell(CellElement,
             CellElement.getLinesSuffix(self.getLineRange())
 
 
+@final
 class ImportCell(CellElement,
                  TextMixin, ColorMixin, IconMixin, QGraphicsRectItem):
 
@@ -721,9 +733,10 @@ class ImportCell(CellElement,
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.importBGColor,
-                            self.canvas.settings.importFGColor,
-                            self.canvas.settings.importBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.importBGColor,
+                            settings.importFGColor,
+                            settings.importBorderColor)
         IconMixin.__init__(self, canvas, 'import.svg', 'import')
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
         self.kind = CellElement.IMPORT
@@ -836,6 +849,7 @@ class ImportCell(CellElement,
         return 'Import at ' + CellElement.getLinesSuffix(self.getLineRange())
 
 
+@final
 class DecoratorCell(CellElement,
                     TextMixin, ColorMixin, QGraphicsRectItem):
 
@@ -848,14 +862,15 @@ class DecoratorCell(CellElement,
         self.scopeItem = scopeItem
         self.isFirst = False
 
+        settings = canvas.settings
         if self.scopeItem.kind == CellElement.CLASS_SCOPE:
-            bgColor = self.canvas.settings.classScopeBGColor
-            fgColor = self.canvas.settings.classScopeFGColor
-            borderColor = self.canvas.settings.classScopeBorderColor
+            bgColor = settings.classScopeBGColor
+            fgColor = settings.classScopeFGColor
+            borderColor = settings.classScopeBorderColor
         else:
-            bgColor = self.canvas.settings.funcScopeBGColor
-            fgColor = self.canvas.settings.funcScopeFGColor
-            borderColor = self.canvas.settings.funcScopeBorderColor
+            bgColor = settings.funcScopeBGColor
+            fgColor = settings.funcScopeFGColor
+            borderColor = settings.funcScopeBorderColor
 
         ColorMixin.__init__(self, ref, bgColor, fgColor, borderColor)
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
@@ -997,6 +1012,7 @@ class DecoratorCell(CellElement,
         return self.scopeItem.ref.getParentIfID()
 
 
+@final
 class IfCell(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
 
     """Represents a single if statement"""
@@ -1004,9 +1020,10 @@ class IfCell(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
     def __init__(self, ref, canvas, x, y):
         CellElement.__init__(self, ref, canvas, x, y)
         TextMixin.__init__(self)
-        ColorMixin.__init__(self, ref, self.canvas.settings.ifBGColor,
-                            self.canvas.settings.ifFGColor,
-                            self.canvas.settings.ifBorderColor)
+        settings = canvas.settings
+        ColorMixin.__init__(self, ref, settings.ifBGColor,
+                            settings.ifFGColor,
+                            settings.ifBorderColor)
         QGraphicsRectItem.__init__(self, canvas.scopeRectangle)
         self.kind = CellElement.IF
         self.vConnector = None
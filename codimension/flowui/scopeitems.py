@@ -24,6 +24,8 @@
 # pylint: disable=W0702
 # pylint: disable=R0913
 
+from enum import IntEnum
+from typing import final
 from html import escape
 from ui.qt import Qt, QPen, QBrush, QGraphicsRectItem, QGraphicsItem, QPointF, QColor
 from utils.limits import MAXINT_32
@@ -38,6 +40,7 @@ from .textmixin import TextMixin
 from .abovebadges import AboveBadgesSpacer
 
 
+@final
 class ScopeHSideEdge(HSpacerCell):
 
     """Reserves some space for the scope horizontal edge"""
@@ -49,6 +52,7 @@ class ScopeHSideEdge(HSpacerCell):
         self.kind = CellElement.SCOPE_H_SIDE_EDGE
 
 
+@final
 class ScopeVSideEdge(VSpacerCell):
 
     """Reserves some space for the scope vertical edge"""
@@ -60,6 +64,7 @@ class ScopeVSideEdge(VSpacerCell):
         self.kind = CellElement.SCOPE_V_SIDE_EDGE
 
 
+@final
 class ScopeSpacer(SpacerCell):
 
     """Reserves some space for the scope corner"""
@@ -73,14 +78,33 @@ class ScopeSpacer(SpacerCell):
         self.kind = CellElement.SCOPE_CORNER_EDGE
 
 
-class ScopeCellElement(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
+class ScopeSubKind(IntEnum):
 
-    """Base class for the scope items"""
+    """Sub kinds of the scope cell elements"""
 
     TOP_LEFT = 0
     DECLARATION = 1
     DOCSTRING = 3
 
+
+class ScopeCellElement(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
+
+    """Base class for the scope items"""
+
+    # Source compatibility aliases: the sub kinds are traditionally
+    # accessed as ScopeCellElement.<NAME>
+    TOP_LEFT = ScopeSubKind.TOP_LEFT
+    DECLARATION = ScopeSubKind.DECLARATION
+    DOCSTRING = ScopeSubKind.DOCSTRING
+
+    # The derived classes describe what the generic render() puts above
+    # the scope rectangle instead of duplicating the rendering code
+    badgeText = None
+    hasDocstringBadge = False
+    hasDecorBadges = False
+    hasExceptBadges = False
+    scopeName = None
+
     def __init__(self, ref, canvas, x, y, subKind,
                  bgColor, fgColor, borderColor):
         isDocstring = subKind == ScopeCellElement.DOCSTRING
@@ -157,6 +181,33 @@ class ScopeCellElement(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
         self.minWidth = self.textRect.width() + 2 * (s.hHeaderPadding -
                                                      s.scopeRectRadius)
 
+    def render(self):
+        """Renders the scope element as described by the derived class"""
+        if self.subKind == ScopeCellElement.TOP_LEFT:
+            self.aboveBadges.append(BadgeItem(self, self.badgeText))
+            s = self.canvas.settings
+            groupSpacerAdded = False
+            if self.hasDocstringBadge:
+                if self.ref.docstring and s.hidedocstrings and \
+                   not s.noDocstring:
+                    self.appendSpacerAndBadge(groupSpacerAdded,
+                                              DocstringBadgeItem(self, 'doc'))
+                    groupSpacerAdded = True
+            if self.hasDecorBadges:
+                if self.ref.decorators and s.hidedecors and not s.noDecor:
+                    for index, _ in enumerate(self.ref.decorators):
+                        self.appendSpacerAndBadge(
+                            groupSpacerAdded, ScopeDecorBadgeItem(self, index))
+                        groupSpacerAdded = True
+            groupSpacerAdded = \
+                self.appendScopeCommentBadges(groupSpacerAdded)
+            if self.hasExceptBadges and s.hideexcepts:
+                for index, _ in enumerate(self.ref.exceptParts):
+                    self.appendSpacerAndBadge(groupSpacerAdded,
+                                              ExceptBadgeItem(self, index))
+                    groupSpacerAdded = True
+        return self.renderCell()
+
     def renderCell(self):
         """Provides rendering for the scope elements"""
         if self.subKind == ScopeCellElement.TOP_LEFT:
@@ -541,8 +592,8 @@ class ScopeCellElement(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
             column = self.addr[0] - 1
             row = self.addr[1] - 1
             return self.canvas.cells[row][column]
-        raise Exception("Logical error: the getTopLeftItem() is designed "
-                        "to be called for the DECLARATION only")
+        raise RuntimeError("Logical error: the getTopLeftItem() is designed "
+                           "to be called for the DECLARATION only")
 
     def getDistance(self, absPos):
         """Provides a distance between the absPos and the item"""
@@ -602,6 +653,22 @@ class ScopeCellElement(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
             return min(self.ref.docstring.beginLine, line)
         return CellElement.getFirstLine(self)
 
+    def getLineRange(self):
+        """Provides the line range"""
+        if self.subKind == self.DOCSTRING:
+            return self.ref.docstring.body.getLineRange()
+        return CellElement.getLineRange(self)
+
+    def getAbsPosRange(self):
+        """Provides the absolute position range"""
+        if self.subKind == self.DOCSTRING:
+            return self.ref.docstring.body.getAbsPosRange()
+        return self.ref.getAbsPosRange()
+
+    def getSelectTooltip(self):
+        """Provides the selection tooltip"""
+        return self.scopeName + self.getTooltipSuffix()
+
     def getTooltipSuffix(self):
         """Provides the selection tooltip suffix"""
         if self.subKind == self.TOP_LEFT:
@@ -638,22 +705,40 @@ class ScopeCellElement(CellElement, TextMixin, ColorMixin, QGraphicsRectItem):
             self.aboveBadges.append(AboveBadgesSpacer(s.badgeGroupSpacing))
         self.aboveBadges.append(badge)
 
-
-_scopeCellElementToString = {
-    ScopeCellElement.TOP_LEFT: "TOP_LEFT",
-    ScopeCellElement.DECLARATION: "DECLARATION",
-    ScopeCellElement.DOCSTRING: "DOCSTRING"}
+    def appendScopeCommentBadges(self, groupSpacerAdded):
+        """Appends the doc link and comment badges common to all scopes"""
+        s = self.canvas.settings
+        if s.hidecomments and not s.noComment:
+            leadingDoc = getDocComment(self.ref.leadingCMLComments)
+            if leadingDoc:
+                self.appendSpacerAndBadge(groupSpacerAdded,
+                                          DocLinkBadgeItem(self))
+                groupSpacerAdded = True
+            if self.ref.leadingComment:
+                self.appendSpacerAndBadge(groupSpacerAdded,
+                                          CommentBadgeItem(self, False))
+                groupSpacerAdded = True
+            if self.ref.sideComment:
+                self.appendSpacerAndBadge(groupSpacerAdded,
+                                          CommentBadgeItem(self, True))
+                groupSpacerAdded = True
+        return groupSpacerAdded
 
 
 def scopeCellElementToString(kind):
     """Provides a string representation of a element kind"""
-    return _scopeCellElementToString[kind]
+    return ScopeSubKind(kind).name
 
 
+@final
 class FileScopeCell(ScopeCellElement):
 
     """Represents a file scope element"""
 
+    badgeText = 'module'
+    hasDocstringBadge = True
+    scopeName = 'Module'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.fileScopeBGColor,
@@ -661,32 +746,6 @@ class FileScopeCell(ScopeCellElement):
                                   canvas.settings.fileScopeBorderColor)
         self.kind = CellElement.FILE_SCOPE
 
-    def render(self):
-        """Renders the file scope element"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, 'module'))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if self.ref.docstring and s.hidedocstrings and not s.noDocstring:
-                self.appendSpacerAndBadge(groupSpacerAdded,
-                                          DocstringBadgeItem(self, 'doc'))
-                groupSpacerAdded = True
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
     def getLineRange(self):
         """Provides the line range"""
         if self.subKind == self.TOP_LEFT:
@@ -707,15 +766,17 @@ class FileScopeCell(ScopeCellElement):
             return self.ref.docstring.body.getAbsPosRange()
         return self.ref.getAbsPosRange()
 
-    def getSelectTooltip(self):
-        """Provides a file scope selected tooltip"""
-        return 'Module' + self.getTooltipSuffix()
-
 
+@final
 class FunctionScopeCell(ScopeCellElement):
 
     """Represents a function scope element"""
 
+    badgeText = 'def'
+    hasDocstringBadge = True
+    hasDecorBadges = True
+    scopeName = 'Function'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.funcScopeBGColor,
@@ -723,58 +784,17 @@ class FunctionScopeCell(ScopeCellElement):
                                   canvas.settings.funcScopeBorderColor)
         self.kind = CellElement.FUNC_SCOPE
 
-    def render(self):
-        """Renders the function scope element"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, 'def'))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if self.ref.docstring and s.hidedocstrings and not s.noDocstring:
-                self.appendSpacerAndBadge(groupSpacerAdded,
-                                          DocstringBadgeItem(self, 'doc'))
-                groupSpacerAdded = True
-            if self.ref.decorators and s.hidedecors and not s.noDecor:
-                for index, _ in enumerate(self.ref.decorators):
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              ScopeDecorBadgeItem(self, index))
-                    groupSpacerAdded = True
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getLineRange(self):
-        """Provides the line range"""
-        if self.subKind == self.DOCSTRING:
-            return self.ref.docstring.body.getLineRange()
-        return CellElement.getLineRange(self)
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        if self.subKind == self.DOCSTRING:
-            return self.ref.docstring.body.getAbsPosRange()
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides a selected function block tooltip"""
-        return 'Function' + self.getTooltipSuffix()
-
 
+@final
 class ClassScopeCell(ScopeCellElement):
 
     """Represents a class scope element"""
 
+    badgeText = 'class'
+    hasDocstringBadge = True
+    hasDecorBadges = True
+    scopeName = 'Class'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.classScopeBGColor,
@@ -782,58 +802,15 @@ class ClassScopeCell(ScopeCellElement):
                                   canvas.settings.classScopeBorderColor)
         self.kind = CellElement.CLASS_SCOPE
 
-    def render(self):
-        """Renders the class scope element"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, 'class'))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if self.ref.docstring and s.hidedocstrings and not s.noDocstring:
-                self.appendSpacerAndBadge(groupSpacerAdded,
-                                          DocstringBadgeItem(self, 'doc'))
-                groupSpacerAdded = True
-            if self.ref.decorators and s.hidedecors and not s.noDecor:
-                for index, _ in enumerate(self.ref.decorators):
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              ScopeDecorBadgeItem(self, index))
-                    groupSpacerAdded = True
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getLineRange(self):
-        """Provides the line range"""
-        if self.subKind == self.DOCSTRING:
-            return self.ref.docstring.body.getLineRange()
-        return CellElement.getLineRange(self)
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        if self.subKind == self.DOCSTRING:
-            return self.ref.docstring.body.getAbsPosRange()
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides the selection tooltip"""
-        return 'Class' + self.getTooltipSuffix()
-
 
+@final
 class ForScopeCell(ScopeCellElement):
 
     """Represents a for-loop scope element"""
 
+    badgeText = 'for'
+    scopeName = 'For loop'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.forScopeBGColor,
@@ -841,41 +818,15 @@ class ForScopeCell(ScopeCellElement):
                                   canvas.settings.forScopeBorderColor)
         self.kind = CellElement.FOR_SCOPE
 
-    def render(self):
-        """Renders the for-loop scope element"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "for"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides a selected for block tooltip"""
-        return 'For loop' + self.getTooltipSuffix()
-
 
+@final
 class WhileScopeCell(ScopeCellElement):
 
     """Represents a while-loop scope element"""
 
+    badgeText = 'while'
+    scopeName = 'While loop'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.whileScopeBGColor,
@@ -883,41 +834,16 @@ class WhileScopeCell(ScopeCellElement):
                                   canvas.settings.whileScopeBorderColor)
         self.kind = CellElement.WHILE_SCOPE
 
-    def render(self):
-        """Renders the while-loop scope element"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "while"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides the selected while scope element tooltip"""
-        return 'While loop' + self.getTooltipSuffix()
-
 
+@final
 class TryScopeCell(ScopeCellElement):
 
     """Represents a try-except scope element"""
 
+    badgeText = 'try'
+    hasExceptBadges = True
+    scopeName = 'Try'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.tryScopeBGColor,
@@ -925,33 +851,6 @@ class TryScopeCell(ScopeCellElement):
                                   canvas.settings.tryScopeBorderColor)
         self.kind = CellElement.TRY_SCOPE
 
-    def render(self):
-        """Renders the try scope element"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "try"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-            if s.hideexcepts:
-                for index, _ in enumerate(self.ref.exceptParts):
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              ExceptBadgeItem(self, index))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
     def getLineRange(self):
         """Provides the line range"""
         if self.subKind == self.TOP_LEFT:
@@ -966,15 +865,15 @@ class TryScopeCell(ScopeCellElement):
         _, end = self.ref.suite[-1].getAbsPosRange()
         return [begin, end]
 
-    def getSelectTooltip(self):
-        """Provides the selected try block tooltip"""
-        return 'Try' + self.getTooltipSuffix()
-
 
+@final
 class WithScopeCell(ScopeCellElement):
 
     """Represents a with scope element"""
 
+    badgeText = 'with'
+    scopeName = 'With'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.withScopeBGColor,
@@ -982,36 +881,6 @@ class WithScopeCell(ScopeCellElement):
                                   canvas.settings.withScopeBorderColor)
         self.kind = CellElement.WITH_SCOPE
 
-    def render(self):
-        """Renders the with block"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "with"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides the selected with block tooltip"""
-        return 'With' + self.getTooltipSuffix()
-
 
 class ElseScopeCell(ScopeCellElement):
 
@@ -1021,6 +890,9 @@ class ElseScopeCell(ScopeCellElement):
     WHILE_STATEMENT = 1
     TRY_STATEMENT = 2
 
+    badgeText = 'else'
+    scopeName = 'Else'
+
     def __init__(self, ref, canvas, x, y, subKind, statement):
         if statement == self.FOR_STATEMENT:
             bgColor = canvas.settings.forElseScopeBGColor
@@ -1041,37 +913,8 @@ class ElseScopeCell(ScopeCellElement):
         self.statement = statement
         self.after = self
 
-    def render(self):
-        """Renders the else block"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "else"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides the selection tooltip"""
-        return 'Else' + self.getTooltipSuffix()
-
 
+@final
 class ForElseScopeCell(ElseScopeCell):
 
     """Else scope which is bound to a for loop"""
@@ -1081,6 +924,7 @@ class ForElseScopeCell(ElseScopeCell):
                                ElseScopeCell.FOR_STATEMENT)
 
 
+@final
 class WhileElseScopeCell(ElseScopeCell):
 
     """Else scope which is bound to a while loop"""
@@ -1090,6 +934,7 @@ class WhileElseScopeCell(ElseScopeCell):
                                ElseScopeCell.WHILE_STATEMENT)
 
 
+@final
 class TryElseScopeCell(ElseScopeCell):
 
     """Else scope which is bound to a try block"""
@@ -1099,10 +944,14 @@ class TryElseScopeCell(ElseScopeCell):
                                ElseScopeCell.TRY_STATEMENT)
 
 
+@final
 class ExceptScopeCell(ScopeCellElement):
 
     """Represents an except scope element"""
 
+    badgeText = 'except'
+    scopeName = 'Except'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.exceptScopeBGColor,
@@ -1110,75 +959,18 @@ class ExceptScopeCell(ScopeCellElement):
                                   canvas.settings.exceptScopeBorderColor)
         self.kind = CellElement.EXCEPT_SCOPE
 
-    def render(self):
-        """Renders the except block"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "except"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides the selection tooltip"""
-        return 'Except' + self.getTooltipSuffix()
-
 
+@final
 class FinallyScopeCell(ScopeCellElement):
 
     """Represents a finally scope element"""
 
+    badgeText = 'finally'
+    scopeName = 'Finally'
+
     def __init__(self, ref, canvas, x, y, subKind):
         ScopeCellElement.__init__(self, ref, canvas, x, y, subKind,
                                   canvas.settings.finallyScopeBGColor,
                                   canvas.settings.finallyScopeFGColor,
                                   canvas.settings.finallyScopeBorderColor)
         self.kind = CellElement.FINALLY_SCOPE
-
-    def render(self):
-        """Renders the finally block"""
-        if self.subKind == ScopeCellElement.TOP_LEFT:
-            self.aboveBadges.append(BadgeItem(self, "finally"))
-            s = self.canvas.settings
-            groupSpacerAdded = False
-            if s.hidecomments and not s.noComment:
-                leadingDoc = getDocComment(self.ref.leadingCMLComments)
-                if leadingDoc:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              DocLinkBadgeItem(self))
-                    groupSpacerAdded = True
-                if self.ref.leadingComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, False))
-                    groupSpacerAdded = True
-                if self.ref.sideComment:
-                    self.appendSpacerAndBadge(groupSpacerAdded,
-                                              CommentBadgeItem(self, True))
-                    groupSpacerAdded = True
-        return self.renderCell()
-
-    def getAbsPosRange(self):
-        """Provides the absolute position range"""
-        return self.ref.getAbsPosRange()
-
-    def getSelectTooltip(self):
-        """Provides a tooltip for the selected finally block"""
-        return 'Finally' + self.getTooltipSuffix()
-
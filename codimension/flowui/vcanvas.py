@@ -60,13 +60,17 @@ from .docitems import IndependentDocCell, LeadingDocCell, AboveDocCell
 from .routines import getDocComment
 
 
-CONN_N_S = [(ConnectorCell.NORTH, ConnectorCell.SOUTH)]
-CONN_W_E = [(ConnectorCell.WEST, ConnectorCell.EAST)]
-CONN_E_W = [(ConnectorCell.EAST, ConnectorCell.WEST)]
-CONN_N_W = [(ConnectorCell.NORTH, ConnectorCell.WEST)]
-CONN_W_S = [(ConnectorCell.WEST, ConnectorCell.SOUTH)]
-CONN_E_S = [(ConnectorCell.EAST, ConnectorCell.SOUTH)]
-CONN_N_C = [(ConnectorCell.NORTH, ConnectorCell.CENTER)]
+# Tuples so the same immutable connection spec is shared by all the
+# connector cells instead of referencing mutable lists
+CONN_N_S = ((ConnectorCell.NORTH, ConnectorCell.SOUTH),)
+CONN_W_E = ((ConnectorCell.WEST, ConnectorCell.EAST),)
+CONN_E_W = ((ConnectorCell.EAST, ConnectorCell.WEST),)
+CONN_N_W = ((ConnectorCell.NORTH, ConnectorCell.WEST),)
+CONN_W_S = ((ConnectorCell.WEST, ConnectorCell.SOUTH),)
+CONN_E_S = ((ConnectorCell.EAST, ConnectorCell.SOUTH),)
+CONN_N_C = ((ConnectorCell.NORTH, ConnectorCell.CENTER),)
+CONN_N_S_E_C = ((ConnectorCell.NORTH, ConnectorCell.SOUTH),
+                (ConnectorCell.EAST, ConnectorCell.CENTER))
 
 _scopeToClass = {
     CellElement.NO_SCOPE: None,
@@ -110,6 +114,13 @@ _terminalCellTypes = (
     CellElement.RAISE,
     CellElement.SYSEXIT)
 
+_tailCommentKinds = frozenset((
+    CellElement.LEADING_COMMENT,
+    CellElement.INDEPENDENT_COMMENT,
+    CellElement.SIDE_COMMENT,
+    CellElement.ABOVE_COMMENT,
+    CellElement.INDEPENDENT_MINIMIZED_COMMENT))
+
 
 class VirtualCanvas:
 
@@ -1189,11 +1200,7 @@ class VirtualCanvas:
                 else:
                     self.__allocateAndSet(
                         vacantRow, 0,
-                        ConnectorCell([(ConnectorCell.NORTH,
-                                        ConnectorCell.SOUTH),
-                                       (ConnectorCell.EAST,
-                                        ConnectorCell.CENTER)],
-                                      self, 0, vacantRow))
+                        ConnectorCell(CONN_N_S_E_C, self, 0, vacantRow))
             else:
                 self.__allocateAndSet(vacantRow, 0,
                                       ConnectorCell(CONN_N_S,
@@ -1207,11 +1214,7 @@ class VirtualCanvas:
                     self.__allocateAndSet(vacantRow, 1, bottomConnector)
                     self.__allocateAndSet(
                         vacantRow, 0,
-                        ConnectorCell([(ConnectorCell.NORTH,
-                                        ConnectorCell.SOUTH),
-                                       (ConnectorCell.EAST,
-                                        ConnectorCell.CENTER)],
-                                      self, 0, vacantRow))
+                        ConnectorCell(CONN_N_S_E_C, self, 0, vacantRow))
         else:
             if nBranch.kind == CellElement.VCANVAS:
                 if yBelow:
@@ -1293,11 +1296,7 @@ class VirtualCanvas:
                 self.__allocateAndSet(vacantRow, 1, bottomConnector)
                 self.__allocateAndSet(
                     vacantRow, 0,
-                    ConnectorCell([(ConnectorCell.NORTH,
-                                    ConnectorCell.SOUTH),
-                                   (ConnectorCell.EAST,
-                                    ConnectorCell.CENTER)],
-                                  self, 0, vacantRow))
+                    ConnectorCell(CONN_N_S_E_C, self, 0, vacantRow))
 
         self.dependentRegions.append((dependentRegionBegin, vacantRow))
 
@@ -1309,7 +1308,7 @@ class VirtualCanvas:
             if self.cells[0][0].subKind == ScopeCellElement.TOP_LEFT:
                 self.cells[0][0].leaderRef = ref
                 return
-        raise Exception("Logic error: cannot set the leader reference")
+        raise RuntimeError("Logic error: cannot set the leader reference")
 
     def layoutModule(self, cflow):
         """Lays out a module"""
@@ -1615,11 +1614,7 @@ class VirtualCanvas:
         while index <= end:
             row = self.cells[index]
             if row:
-                if row[-1].kind in [CellElement.LEADING_COMMENT,
-                                    CellElement.INDEPENDENT_COMMENT,
-                                    CellElement.SIDE_COMMENT,
-                                    CellElement.ABOVE_COMMENT,
-                                    CellElement.INDEPENDENT_MINIMIZED_COMMENT]:
+                if row[-1].kind in _tailCommentKinds:
                     row[-1].tailComment = True
             index += 1
 
@@ -1629,20 +1624,22 @@ class VirtualCanvas:
             while index <= end:
                 row = self.cells[index]
                 if column < len(row):
-                    row[column].render()
-                    if not row[column].scopedItem():
-                        if row[column].isComment() or row[column].isCMLDoc():
-                            row[column].adjustWidth()
-                    if not row[column].tailComment:
-                        maxColumnWidth = max(row[column].width, maxColumnWidth)
+                    cell = row[column]
+                    cell.render()
+                    if not cell.scopedItem():
+                        if cell.isComment() or cell.isCMLDoc():
+                            cell.adjustWidth()
+                    if not cell.tailComment:
+                        maxColumnWidth = max(cell.width, maxColumnWidth)
                 index += 1
 
             index = start
             while index <= end:
                 row = self.cells[index]
                 if column < len(row):
-                    if not row[column].tailComment:
-                        row[column].width = maxColumnWidth
+                    cell = row[column]
+                    if not cell.tailComment:
+                        cell.width = maxColumnWidth
                 index += 1
 
         # Update the row height and calculate the row width.
@@ -33,6 +33,10 @@ class Match:
 
     """Stores info about one match in a file"""
 
+    # A search may produce thousands of matches so no per instance
+    # __dict__ is carried
+    __slots__ = ('line', 'start', 'finish', 'tooltip', 'text')
+
     def __init__(self, line, start, finish):
         self.line = line        # Matched line
         self.start = start      # Match start pos
@@ -57,6 +61,8 @@ class ItemToSearchIn:
 
     contextLines = 15
 
+    __slots__ = ('fileName', 'bufferUUID', 'tooltip', 'matches')
+
     def __init__(self, fname, bufferID):
         self.fileName = fname       # Could be absolute -> for existing files
                                     # or relative -> for newly created
@@ -43,6 +43,7 @@ from utils.encoding import detectEolString
 from diagram.importsdgmgraphics import ImportDgmTabWidget
 from editor.vcsannotateviewer import VCSAnnotateViewerTabWidget
 from editor.texteditortabwidget import TextEditorTabWidget
+from editor.qpartwrap import QutepartWrapper
 from .qt import (Qt, QDir, QUrl, pyqtSignal, QIcon, QTabWidget,
                  QDialog, QMessageBox, QWidget, QHBoxLayout, QMenu,
                  QToolButton, QShortcut, QFileDialog, QApplication, QTabBar)
@@ -103,6 +104,7 @@ class EditorsManager(QTabWidget):
 
         self.__newIndex = -1
         self.newCloneIndex = -1
+        self.__uuidToWidget = None  # Lazily built uuid -> widget map
         self.__mainWindow = parent
         self.__navigationMenu = None
         self.__historyBackMenu = None
@@ -1707,8 +1709,8 @@ class EditorsManager(QTabWidget):
         self.activateTab(index)
         if widget.getType() in [MainWindowTabWidgetBase.PlainTextEditor,
                                 MainWindowTabWidgetBase.VCSAnnotateViewer]:
-            if widget.getLine() != entry.line or \
-               widget.getPos() != entry.pos or \
+            line, pos = widget.getLinePos()
+            if line != entry.line or pos != entry.pos or \
                widget.getEditor().firstVisibleLine() != entry.firstVisible:
                 # Need to jump to the memorized position because something
                 # has been changed
@@ -1796,8 +1798,7 @@ class EditorsManager(QTabWidget):
         """Triggered when the cursor position changed"""
         widget = self.currentWidget()
         mainWindow = self.__mainWindow
-        line = widget.getLine()
-        pos = widget.getPos()
+        line, pos = widget.getLinePos()
 
         if line is not None and pos is not None:
             mainWindow.sbLine.setText("Line: " + str(line + 1))
@@ -1826,12 +1827,11 @@ class EditorsManager(QTabWidget):
         eol = currentWidget.getEol()
         mainWindow.sbEol.setText(eol if eol else 'n/a')
 
-        cPos = currentWidget.getPos()
+        cLine, cPos = currentWidget.getLinePos()
         if cPos is not None:
             mainWindow.sbPos.setText('Pos: ' + str(cPos + 1))
         else:
             mainWindow.sbPos.setText('Pos: n/a')
-        cLine = currentWidget.getLine()
         if cLine is not None:
             mainWindow.sbLine.setText('Line: ' + str(cLine + 1))
         else:
@@ -2132,13 +2132,16 @@ class EditorsManager(QTabWidget):
                     # properly for the case when auto line wrap toggled
                     item.resizeBars()
 
-    def resetTextSearchMatchCache(self):
+    def resetTextSearchMatchCache(self, excludeEditor=None):
         """Resets all the buffers match cache"""
-        for index in range(self.count()):
-            item = self.widget(index)
-            if item.getType() in [MainWindowTabWidgetBase.PlainTextEditor,
-                                  MainWindowTabWidgetBase.VCSAnnotateViewer]:
-                item.getEditor().resetMatchCache()
+        # Only the editors which actually hold a populated cache are visited;
+        # the common case is that only the excluded editor has one
+        cached = QutepartWrapper.cachedMatchEditors
+        if not cached or (len(cached) == 1 and excludeEditor in cached):
+            return
+        for editor in list(cached):
+            if editor is not excludeEditor:
+                editor.resetMatchCache()
 
     def updateCFEditorsSettings(self):
         """Visits all the visible CF editors"""
@@ -2147,13 +2150,25 @@ class EditorsManager(QTabWidget):
             if item.getType() in [MainWindowTabWidgetBase.PlainTextEditor]:
                 item.getCFEditor().updateSettings()
 
+    def tabInserted(self, index):
+        """Qt callback: a tab has been inserted"""
+        del index   # unused argument
+        self.__uuidToWidget = None
+
+    def tabRemoved(self, index):
+        """Qt callback: a tab has been removed"""
+        del index   # unused argument
+        self.__uuidToWidget = None
+
     def getWidgetByUUID(self, uuid):
         """Provides the widget found by the given UUID"""
-        for index in range(self.count()):
-            widget = self.widget(index)
-            if uuid == widget.getUUID():
-                return widget
-        return None
+        # Lookups are much more frequent than tab changes, so the map is
+        # built lazily and invalidated by the tab insert/remove callbacks
+        if self.__uuidToWidget is None:
+            self.__uuidToWidget = {self.widget(index).getUUID():
+                                   self.widget(index)
+                                   for index in range(self.count())}
+        return self.__uuidToWidget.get(uuid)
 
     def getIndexByUUID(self, uuid):
         """Provides the tab index for the given uuid"""
@@ -20,6 +20,7 @@
 """Find and replace widgets implementation"""
 
 import re
+from functools import lru_cache
 from utils.pixmapcache import getIcon
 from utils.globals import GlobalData
 from utils.settings import Settings
@@ -28,10 +29,43 @@ from utils.diskvaluesrelay import getFindHistory, setFindHistory
 from utils.colorfont import setLineEditBackground
 from .qt import (QToolButton, QLabel, QSizePolicy, QComboBox,
                  QGridLayout, QWidget, QCheckBox, QKeySequence, Qt, QSize,
-                 QEvent, pyqtSignal)
+                 QEvent, QTimer, QStringListModel, pyqtSignal)
 from .mainwindowtabwidgetbase import MainWindowTabWidgetBase
 
 
+# Search option flags packed into a single int: compact criteria tuples
+# and a cheaper lru_cache key than three separate bools
+FLAG_REGEXP = 1
+FLAG_WORD = 2
+FLAG_CASE = 4
+
+
+@lru_cache(maxsize=32)
+def _compileSearchRegexp(text, searchFlags):
+    """Compiles the search criteria into a regexp.
+
+    Incremental search repeats the same criteria on nearly every
+    keystroke so the compiled regexps are cached. Returning a stable
+    regexp object also lets the editor reuse its matches cache instead
+    of rescanning the buffer for an identical search.
+    Provides (regexp, None) or (None, error message).
+    """
+    pattern = text.replace('\u2029', '\n')  # unicode paragraph -> \n
+
+    if not searchFlags & FLAG_REGEXP:
+        pattern = re.escape(pattern)
+    if searchFlags & FLAG_WORD:
+        pattern = r'\b' + pattern + r'\b'
+
+    flags = 0
+    if not searchFlags & FLAG_CASE:
+        flags = re.IGNORECASE
+    try:
+        return re.compile(pattern, flags), None
+    except re.error as ex:
+        return None, str(ex)
+
+
 class ComboBoxNoUndo(QComboBox):
 
     """Combo box which allows application wide Ctrl+Z etc."""
@@ -90,22 +124,37 @@ class FindReplaceWidget(QWidget):
         self.__editor = None
         self.__subscribedToCursor = False
 
+        # The editor subscription flips on every tab change; cache the
+        # bound slots so connect/disconnect reuse the same references
+        self.__cursorSlot = self.__cursorPositionChanged
+        self.__highlightSlot = self.onQuickHighlight
+        self.__textChangedSlot = self.__onTextChanged
+
         self.__createLayout()
         self.__changesConnected = False
         self.__connectOnChanges()
 
-        self.__history = getFindHistory()
+        self.__loadHistory()
         self.__populateHistory()
 
         # Incremental search support
         self.__startPoint = None    # {'absPos': int, 'firstVisible': int}
 
+        # Last (on match, replace all possible) state of the replace
+        # buttons; None when somebody else touched the buttons
+        self.__lastReplaceState = None
+
+        # Coalesces bursts of keystrokes into one search
+        self.__searchTimer = QTimer(self)
+        self.__searchTimer.setSingleShot(True)
+        self.__searchTimer.timeout.connect(self.__onSearchTimer)
+
         GlobalData().project.sigProjectChanged.connect(self.__onProjectChanged)
 
         lineEdit = self.findtextCombo.lineEdit()
+        self.__idleColor = lineEdit.palette().color(lineEdit.backgroundRole())
         self.__stateColors = {
-            self.BG_IDLE:
-                lineEdit.palette().color(lineEdit.backgroundRole()),
+            self.BG_IDLE: self.__idleColor,
             self.BG_NOMATCH:
                 GlobalData().skin['findNoMatchPaper'],
             self.BG_MATCH:
@@ -117,7 +166,7 @@ class FindReplaceWidget(QWidget):
         """Sets the search combo background color to reflect the state"""
         setLineEditBackground(self.findtextCombo.lineEdit(),
                               self.__stateColors[state],
-                              self.__stateColors[self.BG_IDLE])
+                              self.__idleColor)
 
     def __createLayout(self):
         """Creates the layout of the widget"""
@@ -136,6 +185,7 @@ class FindReplaceWidget(QWidget):
             self.findtextCombo.sizePolicy().hasHeightForWidth())
         self.findtextCombo.setSizePolicy(sizePolicy)
         self.findtextCombo.setInsertPolicy(QComboBox.NoInsert)
+        self.findtextCombo.setModel(QStringListModel(self.findtextCombo))
         self.findtextCombo.setCompleter(None)
         self.findtextCombo.setDuplicatesEnabled(False)
         self.findtextCombo.setEnabled(False)
@@ -187,6 +237,7 @@ class FindReplaceWidget(QWidget):
             self.replaceCombo.sizePolicy().hasHeightForWidth())
         self.replaceCombo.setSizePolicy(sizePolicy)
         self.replaceCombo.setInsertPolicy(QComboBox.NoInsert)
+        self.replaceCombo.setModel(QStringListModel(self.replaceCombo))
         self.replaceCombo.setCompleter(None)
         self.replaceCombo.setDuplicatesEnabled(False)
         self.replaceCombo.setEnabled(False)
@@ -219,35 +270,37 @@ class FindReplaceWidget(QWidget):
         self.replaceAndMoveButton.setFocusPolicy(Qt.NoFocus)
         self.replaceAndMoveButton.clicked.connect(self.__onReplaceAndMove)
 
-        # Layout
+        # Layout: all the widgets are fully constructed by this point so
+        # the grid is populated in one batched pass
         self.gridLayout = QGridLayout(self)
         self.gridLayout.setContentsMargins(0, 0, 0, 0)
 
-        self.gridLayout.addWidget(self.closeButton, 0, 0, 1, 1)
-        self.gridLayout.addWidget(self.findLabel, 0, 1, 1, 1)
-        self.gridLayout.addWidget(self.findtextCombo, 0, 2, 1, 1)
-        self.gridLayout.addWidget(self.findPrevButton, 0, 3, 1, 1)
-        self.gridLayout.addWidget(self.findNextButton, 0, 4, 1, 1)
-        self.gridLayout.addWidget(self.caseCheckBox, 0, 5, 1, 1)
-        self.gridLayout.addWidget(self.wordCheckBox, 0, 6, 1, 1)
-        self.gridLayout.addWidget(self.regexpCheckBox, 0, 7, 1, 1)
-
-        self.gridLayout.addWidget(self.replaceLabel, 1, 1, 1, 1)
-        self.gridLayout.addWidget(self.replaceCombo, 1, 2, 1, 1)
-        self.gridLayout.addWidget(self.replaceButton, 1, 3, 1, 1)
-        self.gridLayout.addWidget(self.replaceAndMoveButton, 1, 4, 1, 1)
-        self.gridLayout.addWidget(self.replaceAllButton, 1, 5, 1, 1)
-
-        self.setTabOrder(self.findtextCombo, self.replaceCombo)
-        self.setTabOrder(self.replaceCombo, self.caseCheckBox)
-        self.setTabOrder(self.caseCheckBox, self.wordCheckBox)
-        self.setTabOrder(self.wordCheckBox, self.regexpCheckBox)
-        self.setTabOrder(self.regexpCheckBox, self.findNextButton)
-        self.setTabOrder(self.findNextButton, self.findPrevButton)
-        self.setTabOrder(self.findPrevButton, self.replaceAndMoveButton)
-        self.setTabOrder(self.replaceButton, self.replaceAllButton)
-        self.setTabOrder(self.replaceAndMoveButton, self.replaceAllButton)
-        self.setTabOrder(self.replaceAllButton, self.closeButton)
+        layoutTable = ((self.closeButton, 0, 0),
+                       (self.findLabel, 0, 1),
+                       (self.findtextCombo, 0, 2),
+                       (self.findPrevButton, 0, 3),
+                       (self.findNextButton, 0, 4),
+                       (self.caseCheckBox, 0, 5),
+                       (self.wordCheckBox, 0, 6),
+                       (self.regexpCheckBox, 0, 7),
+                       (self.replaceLabel, 1, 1),
+                       (self.replaceCombo, 1, 2),
+                       (self.replaceButton, 1, 3),
+                       (self.replaceAndMoveButton, 1, 4),
+                       (self.replaceAllButton, 1, 5))
+        self.setUpdatesEnabled(False)
+        for widget, row, column in layoutTable:
+            self.gridLayout.addWidget(widget, row, column, 1, 1)
+        self.setUpdatesEnabled(True)
+
+        focusChain = (self.findtextCombo, self.replaceCombo,
+                      self.caseCheckBox, self.wordCheckBox,
+                      self.regexpCheckBox, self.findNextButton,
+                      self.findPrevButton, self.replaceButton,
+                      self.replaceAndMoveButton, self.replaceAllButton,
+                      self.closeButton)
+        for first, second in zip(focusChain, focusChain[1:]):
+            self.setTabOrder(first, second)
 
     def keyPressEvent(self, event):
         """Handles the ESC key for the search bar"""
@@ -262,9 +315,26 @@ class FindReplaceWidget(QWidget):
     def __onProjectChanged(self, what):
         """Triggered when a project is changed"""
         if what == CodimensionProject.CompleteProject:
-            self.__history = getFindHistory()
+            self.__loadHistory()
             self.__populateHistory()
 
+    def __loadHistory(self):
+        """Loads the history deduplicated by term and capped"""
+        self.__lastHistoryItem = None
+        history = getFindHistory()
+        seen = set()
+        self.__history = []
+        for props in history:
+            term = props['term']
+            if term not in seen:
+                seen.add(term)
+                self.__history.append(props)
+                if len(self.__history) >= self.__maxEntries:
+                    break
+        if len(self.__history) != len(history):
+            # Stale oversized or duplicated history: store the clean one
+            setFindHistory(self.__history)
+
     def __serialize(self):
         """Sirializes a current search/replace parameters"""
         termText = self.findtextCombo.currentText()
@@ -317,25 +387,30 @@ class FindReplaceWidget(QWidget):
     def __populateHistory(self):
         """Populates the history"""
         self.__disconnectOnChanges()
-        index = 0
-        replaceItems = []
+        terms = []
+        self.__historyTerms = set()
+        replaceItems = set()
+        replaceTerms = []
         for props in self.__history:
-            self.findtextCombo.addItem(props['term'], index)
+            terms.append(props['term'])
+            self.__historyTerms.add(props['term'])
             replaceItem = props['replace']
             if replaceItem and replaceItem not in replaceItems:
-                self.replaceCombo.addItem(props['replace'])
-                replaceItems.append(props['replace'])
-            index += 1
-        self.replaceCombo.addItem('')
+                replaceTerms.append(replaceItem)
+                replaceItems.add(replaceItem)
+        replaceTerms.append('')
+        # One model reset each instead of a rowsInserted per item
+        self.findtextCombo.model().setStringList(terms)
+        self.replaceCombo.model().setStringList(replaceTerms)
         self.__connectOnChanges()
 
     def __historyIndexByFindText(self, text):
         """Provides the history index by the find text"""
         if text:
-            for index in range(self.findtextCombo.count()):
-                if self.findtextCombo.itemText(index) == text:
-                    return index, self.findtextCombo.itemData(index)
-        return None, None
+            for index, props in enumerate(self.__history):
+                if props['term'] == text:
+                    return index
+        return None
 
     def __replaceIndex(self, text):
         """Provides the replace combo index by the text"""
@@ -347,33 +422,37 @@ class FindReplaceWidget(QWidget):
 
     def __updateHistory(self):
         """Updates history if needed"""
-        # Add entries to the combo box if required
-        self.__disconnectOnChanges()
-        currentText = self.findtextCombo.currentText()
         historyItem = self.__serialize()
-        _, historyIndex = self.__historyIndexByFindText(currentText)
-        if historyIndex is not None:
+        if historyItem == self.__lastHistoryItem:
+            # Repeated next/prev with unchanged criteria: nothing to store
+            return
+        self.__lastHistoryItem = historyItem
+
+        # The find combo mirrors the history order, so only the delta item
+        # is touched instead of rebuilding both combo models
+        self.__disconnectOnChanges()
+        currentText = historyItem['term']
+        if currentText in self.__historyTerms:
+            historyIndex = self.__historyIndexByFindText(currentText)
             self.__history[historyIndex] = historyItem
         else:
             self.__history.insert(0, historyItem)
+            self.__historyTerms.add(currentText)
+            self.findtextCombo.insertItem(0, currentText)
             if len(self.__history) > self.__maxEntries:
-                self.__history = self.__history[:self.__maxEntries]
-
-        self.findtextCombo.clear()
-        self.replaceCombo.clear()
-        self.__populateHistory()
-
-        self.__disconnectOnChanges()
-        comboIndex, historyIndex = self.__historyIndexByFindText(currentText)
-        self.findtextCombo.setCurrentIndex(comboIndex)
-
-        replaceText = self.__history[historyIndex]['replace']
-        replaceIndex = self.__replaceIndex(replaceText)
-        if replaceIndex:
-            self.replaceCombo.setCurrentIndex(replaceIndex)
-        else:
-            self.replaceCombo.setEditText(
-                self.__history[historyIndex]['replace'])
+                for props in self.__history[self.__maxEntries:]:
+                    self.__historyTerms.discard(props['term'])
+                del self.__history[self.__maxEntries:]
+                while self.findtextCombo.count() > self.__maxEntries:
+                    self.findtextCombo.removeItem(
+                        self.findtextCombo.count() - 1)
+            historyIndex = 0
+        self.findtextCombo.setCurrentIndex(historyIndex)
+
+        replaceText = historyItem['replace']
+        if replaceText and self.__replaceIndex(replaceText) is None:
+            self.replaceCombo.insertItem(0, replaceText)
+        self.replaceCombo.setEditText(replaceText)
         self.__connectOnChanges()
 
         # Save the combo values for further usage
@@ -387,24 +466,26 @@ class FindReplaceWidget(QWidget):
         self.regexpCheckBox.setEnabled(False)
         self.findPrevButton.setEnabled(False)
         self.findNextButton.setEnabled(False)
-        self.replaceButton.setEnabled(False)
-        self.replaceAndMoveButton.setEnabled(False)
-        self.replaceAllButton.setEnabled(False)
+        self.__setReplaceButtonsState(False, False)
         self.replaceCombo.setEnabled(False)
         self.__setBackgroundColor(self.BG_IDLE)
 
     def updateStatus(self):
         """Triggered when the current tab is changed"""
-        self.__unsubscribeFromEditorSignals()
         currentWidget = self.editorsManager.currentWidget()
         validWidgets = [MainWindowTabWidgetBase.PlainTextEditor,
                         MainWindowTabWidgetBase.VCSAnnotateViewer]
         if currentWidget.getType() not in validWidgets:
+            self.__unsubscribeFromEditorSignals()
             self.__editor = None
             self.__disableAll()
             return
 
-        self.__editor = currentWidget.getEditor()
+        editor = currentWidget.getEditor()
+        if editor is not self.__editor:
+            # Re-wire the signals only when the editor actually changed
+            self.__unsubscribeFromEditorSignals()
+            self.__editor = editor
         self.__editor.onTabChanged()
         self.__startPoint = None
 
@@ -427,15 +508,14 @@ class FindReplaceWidget(QWidget):
         self.findNextButton.setEnabled(criteriaValid)
 
         self.replaceCombo.setEnabled(True)
-        self.replaceButton.setEnabled(False)
-        self.replaceAndMoveButton.setEnabled(False)
-        self.replaceAllButton.setEnabled(False)
+        self.__setReplaceButtonsState(False, False)
         self.__subscribeToEditorSignals()
 
     def __isCriteriaValid(self):
         """True if the search criteria is valid"""
-        if self.findtextCombo.currentText() != "":
-            valid, _ = self.__isSearchRegexpValid()
+        text = self.findtextCombo.currentText()
+        if text != "":
+            valid, _ = self.__isSearchRegexpValid(text)
             if valid:
                 return True
         return False
@@ -443,15 +523,12 @@ class FindReplaceWidget(QWidget):
     def show(self, mode, text=''):
         """Overridden show method"""
         self.__disconnectOnChanges()
-        self.findtextCombo.clear()
-        self.replaceCombo.clear()
         self.regexpCheckBox.setChecked(False)
         self.caseCheckBox.setChecked(False)
         self.wordCheckBox.setChecked(False)
 
-        self.__populateHistory()
-
-        self.__disconnectOnChanges()
+        # The combo models are kept in sync with the history as it changes,
+        # so there is no need to rebuild them on every show
         self.findtextCombo.setEditText(text)
         if mode == self.MODE_FIND:
             self.findtextCombo.lineEdit().selectAll()
@@ -486,6 +563,7 @@ class FindReplaceWidget(QWidget):
 
     def hide(self):
         """Overriden hide method"""
+        self.__searchTimer.stop()
         self.__unsubscribeFromEditorSignals()
         QWidget.hide(self)
 
@@ -507,28 +585,43 @@ class FindReplaceWidget(QWidget):
 
     def __onCriteriaChanged(self, _):
         """Triggered when the search text or a checkbox state changed"""
-        # All the opened buffers match cache needs to be reset to trigger
-        # re-search next time the user switches the buffer
-        self.editorsManager.resetTextSearchMatchCache()
+        # Fast typing produces intermediate criteria nobody wants to see
+        # highlighted; only the last one within a short interval is
+        # searched for
+        self.__searchTimer.start(80)
+
+    def __onSearchTimer(self):
+        """Performs the delayed incremental search"""
+        # All the other buffers match cache needs to be reset to trigger
+        # re-search next time the user switches the buffer. The current
+        # buffer cache is kept: identical criteria will reuse it.
+        self.editorsManager.resetTextSearchMatchCache(self.__editor)
 
         self.__performSearch(True, True)
 
+    def __flushPendingSearch(self):
+        """Runs a delayed search immediately if one is pending"""
+        if self.__searchTimer.isActive():
+            self.__searchTimer.stop()
+            self.__onSearchTimer()
+
     def __appendReplaceMessage(self):
         """Appends a proper message to the status bar after replace"""
         mainWindow = GlobalData().mainWindow
         currentMessage = mainWindow.getCurrentStatusBarMessage()
         currentIndex, totalMatches = self.__editor.getMatchesInfo()
         if totalMatches is None or totalMatches == 0:
-            msg = currentMessage + '; no more matches'
+            msg = '%s; no more matches' % currentMessage
         else:
             if currentIndex is not None:
-                msg = currentMessage + '; match %d of %d' % (currentIndex,
-                                                             totalMatches)
+                msg = '%s; match %d of %d' % (currentMessage, currentIndex,
+                                              totalMatches)
             else:
                 if totalMatches == 1:
-                    msg = currentMessage + '; 1 match left'
+                    msg = '%s; 1 match left' % currentMessage
                 else:
-                    msg = currentMessage + '; %d matches left' % totalMatches
+                    msg = '%s; %d matches left' % (currentMessage,
+                                                   totalMatches)
             if totalMatches > Settings()['maxHighlightedMatches']:
                 msg += ' (too many to highlight)'
 
@@ -538,13 +631,13 @@ class FindReplaceWidget(QWidget):
         """Triggered when replace all button is clicked"""
         if self.replaceCombo.isVisible():
             if self.replaceAllButton.isEnabled():
-                replaceText = self.replaceCombo.currentText()
-                self.__editor.replaceAllMatches(replaceText)
+                editor = self.__editor
+                editor.replaceAllMatches(self.replaceCombo.currentText())
                 self.__appendReplaceMessage()
                 self.__cursorPositionChanged()
                 self.__updateHistory()
 
-                count = self.__editor.getCurrentMatchesCount()
+                count = editor.getCurrentMatchesCount()
                 self.__setBackgroundColor(self.BG_NOMATCH if count == 0 else
                                           self.BG_MATCH)
 
@@ -554,14 +647,14 @@ class FindReplaceWidget(QWidget):
         """Triggered when replace current match button is clicked"""
         if self.replaceCombo.isVisible():
             if self.replaceButton.isEnabled():
-                replaceText = self.replaceCombo.currentText()
-                self.__editor.replaceMatch(replaceText)
+                editor = self.__editor
+                editor.replaceMatch(self.replaceCombo.currentText())
                 if not suppressMessage:
                     self.__appendReplaceMessage()
                 self.__cursorPositionChanged()
                 self.__updateHistory()
 
-                count = self.__editor.getCurrentMatchesCount()
+                count = editor.getCurrentMatchesCount()
                 self.__setBackgroundColor(self.BG_NOMATCH if count == 0 else
                                           self.BG_MATCH)
 
@@ -576,34 +669,25 @@ class FindReplaceWidget(QWidget):
                                          False)
                 self.__appendReplaceMessage()
 
-    def __getSearchRegexpAndFlags(self):
-        """Provides the search regular expression and flags"""
-        pattern = self.findtextCombo.currentText()
-        pattern = pattern.replace('\u2029', '\n') # unicode paragraph -> \n
-
-        if not self.regexpCheckBox.isChecked():
-            pattern = re.escape(pattern)
-        if self.wordCheckBox.isChecked():
-            pattern = r'\b' + pattern + r'\b'
-
+    def __getSearchFlags(self):
+        """Packs the option checkboxes into the search flags"""
         flags = 0
-        if not self.caseCheckBox.isChecked():
-            flags = re.IGNORECASE
-        return pattern, flags
-
-    def __getRegexp(self):
-        """Provides a compiled regexp"""
-        pattern, flags = self.__getSearchRegexpAndFlags()
-        return re.compile(pattern, flags)
+        if self.regexpCheckBox.isChecked():
+            flags |= FLAG_REGEXP
+        if self.wordCheckBox.isChecked():
+            flags |= FLAG_WORD
+        if self.caseCheckBox.isChecked():
+            flags |= FLAG_CASE
+        return flags
 
-    def __isSearchRegexpValid(self):
+    def __isSearchRegexpValid(self, text=None):
         """Compilation success and error if so"""
-        pattern, flags = self.__getSearchRegexpAndFlags()
-        try:
-            re.compile(pattern, flags)
-        except re.error as ex:
+        if text is None:
+            text = self.findtextCombo.currentText()
+        regexp, err = _compileSearchRegexp(text, self.__getSearchFlags())
+        if regexp is None:
             self.__setBackgroundColor(self.BG_BROKEN)
-            return False, str(ex)
+            return False, err
         return True, None
 
     def __onInvalidCriteria(self, fromScratch):
@@ -612,9 +696,7 @@ class FindReplaceWidget(QWidget):
 
         self.findNextButton.setEnabled(False)
         self.findPrevButton.setEnabled(False)
-        self.replaceButton.setEnabled(False)
-        self.replaceAndMoveButton.setEnabled(False)
-        self.replaceAllButton.setEnabled(False)
+        self.__setReplaceButtonsState(False, False)
 
         if not fromScratch:
             self.__editor.absCursorPosition = self.__startPoint['absPos']
@@ -632,17 +714,23 @@ class FindReplaceWidget(QWidget):
         if self.__editor is None:
             return
 
-        if self.__startPoint is None:
+        # The fromScratch path records the start point anyway, so do not
+        # read the cursor position twice
+        if self.__startPoint is None and not fromScratch:
             self.__setStartPoint()
 
-        valid, err = self.__isSearchRegexpValid()
-        if not valid:
+        # Read each control once: every call crosses the C++ boundary
+        criteria = (self.findtextCombo.currentText(),
+                    self.__getSearchFlags())
+        regexp, err = _compileSearchRegexp(*criteria)
+        if regexp is None:
+            self.__setBackgroundColor(self.BG_BROKEN)
             self.__onInvalidCriteria(fromScratch)
             GlobalData().mainWindow.showStatusBarMessage(err, 8000)
             self.__moveToStartPoint()
             return
 
-        if self.findtextCombo.currentText() == '':
+        if criteria[0] == '':
             self.__onInvalidCriteria(fromScratch)
             self.__setBackgroundColor(self.BG_IDLE)
             self.__moveToStartPoint()
@@ -655,19 +743,15 @@ class FindReplaceWidget(QWidget):
         if fromScratch:
             # Brand new editor to search in
             self.__setStartPoint()
-            startPos = self.__editor.absCursorPosition
-            if absPos is not None:
-                startPos = absPos
-            count = self.__editor.highlightRegexp(self.__getRegexp(), startPos,
-                                                  forward, needMessage)
-        else:
-            startPos = self.__startPoint['absPos']
-            if absPos is not None:
-                startPos = absPos
-            count = self.__editor.highlightRegexp(self.__getRegexp(), startPos,
-                                                  forward, needMessage)
-            if count == 0:
-                self.__moveToStartPoint()
+        # The start point has just been set for the fromScratch case, so
+        # the editor cursor position does not need to be read again
+        startPos = self.__startPoint['absPos']
+        if absPos is not None:
+            startPos = absPos
+        count = self.__editor.highlightRegexp(regexp, startPos,
+                                              forward, needMessage)
+        if count == 0 and not fromScratch:
+            self.__moveToStartPoint()
         self.__setBackgroundColor(self.BG_MATCH if count > 0
                                   else self.BG_NOMATCH)
 
@@ -691,6 +775,7 @@ class FindReplaceWidget(QWidget):
 
     def onNext(self):
         """Triggered when the find next is clicked"""
+        self.__flushPendingSearch()
         if self.__onPrevNext():
             self.__performSearch(False, True,
                                  self.__editor.absCursorPosition + 1)
@@ -698,6 +783,7 @@ class FindReplaceWidget(QWidget):
 
     def onPrev(self):
         """Triggered when the find prev is clicked"""
+        self.__flushPendingSearch()
         if self.__onPrevNext():
             self.__performSearch(False, False,
                                  self.__editor.absCursorPosition - 1)
@@ -717,27 +803,27 @@ class FindReplaceWidget(QWidget):
     def __setStartPoint(self):
         """Sets the new start point"""
         if self.__editor:
-            self.__startPoint = {
-                'absPos': self.__editor.absCursorPosition,
-                'firstVisible': self.__editor.firstVisibleLine()}
+            point = self.__startPoint
+            if point is None:
+                point = {}
+                self.__startPoint = point
+            point['absPos'] = self.__editor.absCursorPosition
+            point['firstVisible'] = self.__editor.firstVisibleLine()
 
     def __onfindIndexChanged(self, index):
         """Index in history has changed"""
-        if index != -1:
-            historyIndex = self.findtextCombo.itemData(index)
-            if historyIndex is not None:
-                self.__deserialize(self.__history[historyIndex])
-            else:
-                self.__updateHistory()
+        # The combo item order matches the history order
+        if 0 <= index < len(self.__history):
+            self.__deserialize(self.__history[index])
 
     def __subscribeToEditorSignals(self):
         """Subscribes for the cursor position notification"""
         if not self.__subscribedToCursor:
             if self.__editor:
                 self.__editor.cursorPositionChanged.connect(
-                    self.__cursorPositionChanged)
-                self.__editor.sigHighlighted.connect(self.onQuickHighlight)
-                self.__editor.textChanged.connect(self.__onTextChanged)
+                    self.__cursorSlot)
+                self.__editor.sigHighlighted.connect(self.__highlightSlot)
+                self.__editor.textChanged.connect(self.__textChangedSlot)
                 self.__subscribedToCursor = True
 
     def __unsubscribeFromEditorSignals(self):
@@ -746,12 +832,13 @@ class FindReplaceWidget(QWidget):
             if self.__editor:
                 try:
                     self.__editor.textChanged.disconnect(
-                        self.__onTextChanged)
+                        self.__textChangedSlot)
                     self.__editor.sigHighlighted.disconnect(
-                        self.onQuickHighlight)
+                        self.__highlightSlot)
                     self.__editor.cursorPositionChanged.disconnect(
-                        self.__cursorPositionChanged)
-                except:
+                        self.__cursorSlot)
+                except (RuntimeError, TypeError):
+                    # The editor C++ part may already be destroyed
                     pass
             self.__subscribedToCursor = False
 
@@ -760,18 +847,23 @@ class FindReplaceWidget(QWidget):
         if self.findtextCombo.isVisible():
             self.__setBackgroundColor(self.BG_IDLE)
             if self.replaceCombo.isVisible():
-                self.replaceButton.setEnabled(False)
-                self.replaceAndMoveButton.setEnabled(False)
-                self.replaceAllButton.setEnabled(False)
+                self.__setReplaceButtonsState(False, False)
+
+    def __setReplaceButtonsState(self, onMatch, replaceAll):
+        """Toggles the replace buttons, skipping redundant Qt calls"""
+        state = (onMatch, replaceAll)
+        if state == self.__lastReplaceState:
+            return
+        self.__lastReplaceState = state
+        self.replaceButton.setEnabled(onMatch)
+        self.replaceAndMoveButton.setEnabled(onMatch)
+        self.replaceAllButton.setEnabled(replaceAll)
 
     def __cursorPositionChanged(self):
         """Triggered when the cursor position is changed"""
         if self.replaceCombo.isVisible():
             onMatch = self.__editor.isCursorOnMatch()
+            replaceAll = self.__isCriteriaValid() and \
+                self.__editor.getCurrentMatchesCount() > 0
 
-            self.replaceButton.setEnabled(onMatch)
-            self.replaceAndMoveButton.setEnabled(onMatch)
-
-            self.replaceAllButton.setEnabled(
-                self.__isCriteriaValid() and
-                self.__editor.getCurrentMatchesCount() > 0)
+            self.__setReplaceButtonsState(onMatch, replaceAll)
@@ -76,6 +76,10 @@ class MainWindowTabWidgetBase():
         """Tells the cursor column"""
         return None
 
+    def getLinePos(self):
+        """Tells the cursor line and column in one call"""
+        return None, None
+
     def getEncoding(self):
         """Tells the content encoding"""
         return None